@@ -4,6 +4,8 @@ Pytest configuration file for the tests.
 
 import pytest
 
+from zscaler_mcp.client import clear_client_cache
+
 
 def pytest_addoption(parser):
     """
@@ -52,3 +54,15 @@ def _disable_entitlement_filter_by_default(monkeypatch):
     this with ``monkeypatch.delenv("ZSCALER_MCP_DISABLE_ENTITLEMENT_FILTER", raising=False)``.
     """
     monkeypatch.setenv("ZSCALER_MCP_DISABLE_ENTITLEMENT_FILTER", "true")
+
+
+@pytest.fixture(autouse=True)
+def _clear_zscaler_client_cache():
+    """Start and finish every test with an empty SDK client cache.
+
+    ``get_zscaler_client`` memoizes clients per resolved config; without
+    this a client built (or mocked) in one test would leak into the next.
+    """
+    clear_client_cache()
+    yield
+    clear_client_cache()
@@ -12,13 +12,16 @@ This suite covers:
 - private-key fallback via ``ZSCALER_PRIVATE_KEY``
 - ``user_agent_comment`` propagation
 - error paths for missing credentials
+- per-config client caching and ``clear_client_cache``
+- ``ZSCALER_MCP_MAX_RETRIES`` / ``ZSCALER_MCP_MAX_RETRY_SECONDS`` mapping
+- pooled HTTP session per client and ``ZSCALER_MCP_HTTP_POOL_SIZE``
 """
 
 import os
 import unittest
 from unittest.mock import MagicMock, patch
 
-from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.client import clear_client_cache, get_zscaler_client
 
 
 @patch("zscaler_mcp.client.load_dotenv")
@@ -246,5 +249,182 @@ class TestEnvVarFallbacks(unittest.TestCase):
         self.assertEqual(config["privateKey"], "env_pk")
 
 
+@patch("zscaler_mcp.client.load_dotenv")
+class TestClientCache(unittest.TestCase):
+    """Clients are reused per resolved config and dropped by clear_client_cache."""
+
+    _CREDS = {
+        "client_id": "cid",
+        "client_secret": "csecret",
+        "vanity_domain": "example.zscaler.com",
+    }
+
+    def setUp(self):
+        clear_client_cache()
+
+    def tearDown(self):
+        clear_client_cache()
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    def test_same_config_reuses_client(self, mock_client_cls, _dotenv):
+        mock_client_cls.side_effect = lambda config: MagicMock()
+        first = get_zscaler_client(**self._CREDS, service="zia")
+        second = get_zscaler_client(**self._CREDS, service="zia")
+        self.assertIs(first, second)
+        mock_client_cls.assert_called_once()
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    def test_changed_credentials_build_new_client(self, mock_client_cls, _dotenv):
+        mock_client_cls.side_effect = lambda config: MagicMock()
+        first = get_zscaler_client(**self._CREDS)
+        rotated = get_zscaler_client(**{**self._CREDS, "client_secret": "rotated"})
+        self.assertIsNot(first, rotated)
+        self.assertEqual(mock_client_cls.call_count, 2)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    def test_clear_client_cache_forces_rebuild(self, mock_client_cls, _dotenv):
+        mock_client_cls.side_effect = lambda config: MagicMock()
+        first = get_zscaler_client(**self._CREDS)
+        clear_client_cache()
+        second = get_zscaler_client(**self._CREDS)
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_client_cls.call_count, 2)
+
+    def test_clear_client_cache_clears_tool_read_caches(self, _dotenv):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import _dict_cache
+
+        _dict_cache.get_or_fetch(("client", "read", None, None), lambda: ["tenant-a"])
+        clear_client_cache()
+        self.assertEqual(len(_dict_cache), 0)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    def test_cache_is_bounded(self, mock_client_cls, _dotenv):
+        from zscaler_mcp import client as client_module
+
+        mock_client_cls.side_effect = lambda config: MagicMock()
+        for i in range(client_module._CLIENT_CACHE_MAX + 3):
+            get_zscaler_client(**{**self._CREDS, "client_id": f"cid{i}"})
+        self.assertEqual(len(client_module._client_cache), client_module._CLIENT_CACHE_MAX)
+
+
+@patch("zscaler_mcp.client.load_dotenv")
+class TestRetrySettings(unittest.TestCase):
+    """Retry env vars map onto the SDK ``rateLimit`` config block."""
+
+    _CREDS = {
+        "client_id": "cid",
+        "client_secret": "csecret",
+        "vanity_domain": "example.zscaler.com",
+    }
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_no_rate_limit_block_by_default(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        config = mock_client_cls.call_args[0][0]
+        self.assertNotIn("rateLimit", config)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(
+        os.environ,
+        {"ZSCALER_MCP_MAX_RETRIES": "5", "ZSCALER_MCP_MAX_RETRY_SECONDS": "30"},
+        clear=True,
+    )
+    def test_env_vars_populate_rate_limit(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        config = mock_client_cls.call_args[0][0]
+        self.assertEqual(config["rateLimit"], {"maxRetries": 5, "maxRetrySeconds": 30})
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {"ZSCALER_MCP_MAX_RETRIES": "0"}, clear=True)
+    def test_zero_disables_retries(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        config = mock_client_cls.call_args[0][0]
+        self.assertEqual(config["rateLimit"], {"maxRetries": 0})
+
+    @patch.dict(os.environ, {"ZSCALER_MCP_MAX_RETRIES": "lots"}, clear=True)
+    def test_invalid_value_raises(self, _dotenv):
+        with self.assertRaises(ValueError) as ctx:
+            get_zscaler_client(**self._CREDS)
+        self.assertIn("ZSCALER_MCP_MAX_RETRIES", str(ctx.exception))
+
+    @patch.dict(os.environ, {"ZSCALER_MCP_MAX_RETRIES": "-1"}, clear=True)
+    def test_negative_value_raises(self, _dotenv):
+        with self.assertRaises(ValueError):
+            get_zscaler_client(**self._CREDS)
+
+
+@patch("zscaler_mcp.client.load_dotenv")
+class TestHttpSession(unittest.TestCase):
+    """Each cached client gets its own pooled ``requests.Session``."""
+
+    _CREDS = {
+        "client_id": "cid",
+        "client_secret": "csecret",
+        "vanity_domain": "example.zscaler.com",
+    }
+
+    @staticmethod
+    def _installed_session(mock_client_cls):
+        executor = mock_client_cls.return_value.get_request_executor.return_value
+        executor.set_session.assert_called_once()
+        return executor.set_session.call_args[0][0]
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_session_installed_with_default_pool(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        session = self._installed_session(mock_client_cls)
+        self.assertEqual(session.get_adapter("https://api.zsapi.net")._pool_maxsize, 10)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {"ZSCALER_MCP_HTTP_POOL_SIZE": "32"}, clear=True)
+    def test_pool_size_from_env(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        session = self._installed_session(mock_client_cls)
+        self.assertEqual(session.get_adapter("https://api.zsapi.net")._pool_maxsize, 32)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_cached_client_keeps_its_session(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        get_zscaler_client(**self._CREDS)
+        self._installed_session(mock_client_cls)
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_clear_client_cache_closes_session(self, mock_client_cls, _dotenv):
+        get_zscaler_client(**self._CREDS)
+        session = self._installed_session(mock_client_cls)
+        with patch.object(session, "close") as close:
+            clear_client_cache()
+        close.assert_called_once()
+
+    @patch("zscaler_mcp.client.ZscalerClient")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_evicted_client_session_is_closed(self, mock_client_cls, _dotenv):
+        from zscaler_mcp import client as client_module
+
+        mock_client_cls.side_effect = lambda config: MagicMock()
+        sessions = []
+
+        def build_session():
+            sessions.append(MagicMock())
+            return sessions[-1]
+
+        with patch.object(client_module, "_build_session", side_effect=build_session):
+            for i in range(client_module._CLIENT_CACHE_MAX + 1):
+                get_zscaler_client(**{**self._CREDS, "client_id": f"cid{i}"})
+        sessions[0].close.assert_called_once()
+        for session in sessions[1:]:
+            session.close.assert_not_called()
+
+    @patch.dict(os.environ, {"ZSCALER_MCP_HTTP_POOL_SIZE": "0"}, clear=True)
+    def test_invalid_pool_size_raises(self, _dotenv):
+        with self.assertRaises(ValueError) as ctx:
+            get_zscaler_client(**self._CREDS)
+        self.assertIn("ZSCALER_MCP_HTTP_POOL_SIZE", str(ctx.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
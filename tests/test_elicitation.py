@@ -20,6 +20,7 @@ from zscaler_mcp.common.elicitation import (
     check_confirmation,
     extract_confirmed_from_kwargs,
     generate_confirmation_message,
+    requires_confirmation,
     should_skip_confirmations,
 )
 
@@ -318,6 +319,42 @@ class TestCheckConfirmation:
             assert result is None
 
 
+# ---------------------------------------------------------------------------
+# requires_confirmation (decorator)
+# ---------------------------------------------------------------------------
+
+
+@requires_confirmation("item_id")
+def _delete_item(item_id: int, service: str = "zia", kwargs: str = "{}") -> str:
+    return f"Item {item_id} deleted"
+
+
+class TestRequiresConfirmation:
+    def test_without_token_returns_message(self):
+        result = _delete_item(item_id=7)
+        assert "confirmation_token" in result
+        assert "deleted" not in result
+
+    def test_valid_token_runs_body(self):
+        token = _generate_token("_delete_item", {"item_id": "7"})
+        result = _delete_item(7, kwargs=f'{{"confirmation_token": "{token}"}}')
+        assert result == "Item 7 deleted"
+
+    def test_token_is_bound_to_id(self):
+        token = _generate_token("_delete_item", {"item_id": "8"})
+        result = _delete_item(item_id=7, kwargs=f'{{"confirmation_token": "{token}"}}')
+        assert "rejected" in result.lower()
+
+    def test_preserves_signature(self):
+        import inspect
+
+        assert list(inspect.signature(_delete_item).parameters) == [
+            "item_id",
+            "service",
+            "kwargs",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # CWE-345 — HMAC token must be bound to the specific resource ID
 # Regression tests to prevent token replay across different resources.
@@ -0,0 +1,49 @@
+"""Tests for the typed tool error and SDK result unpacking."""
+
+import unittest
+
+from zscaler_mcp.common.errors import ZscalerToolError, check_result
+
+
+class TestZscalerToolError(unittest.TestCase):
+    """Test cases for ZscalerToolError."""
+
+    def test_message_keeps_failed_to_shape(self):
+        exc = ZscalerToolError("list GRE tunnels", "API Error")
+        self.assertEqual(str(exc), "Failed to list GRE tunnels: API Error")
+
+    def test_attributes_are_exposed(self):
+        exc = ZscalerToolError("delete rule 42", "Not Found")
+        self.assertEqual(exc.op, "delete rule 42")
+        self.assertEqual(exc.err, "Not Found")
+
+    def test_exception_err_is_chained_as_cause(self):
+        underlying = ConnectionError("reset by peer")
+        exc = ZscalerToolError("retrieve sandbox quota", underlying)
+        self.assertIs(exc.__cause__, underlying)
+
+    def test_string_err_has_no_cause(self):
+        exc = ZscalerToolError("retrieve sandbox quota", "boom")
+        self.assertIsNone(exc.__cause__)
+
+    def test_is_an_exception_subclass(self):
+        with self.assertRaises(Exception):
+            raise ZscalerToolError("add cloud firewall rule", "boom")
+
+
+class TestCheckResult(unittest.TestCase):
+    """Test cases for check_result."""
+
+    def test_returns_result_element_on_success(self):
+        payload = [{"id": 1}]
+        self.assertIs(check_result((payload, object(), None), "list groups"), payload)
+
+    def test_raises_typed_error_on_failure(self):
+        with self.assertRaises(ZscalerToolError) as ctx:
+            check_result((None, None, "Not Found"), "retrieve group 7")
+        self.assertEqual(str(ctx.exception), "Failed to retrieve group 7: Not Found")
+        self.assertEqual(ctx.exception.err, "Not Found")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,7 @@ import signal
 import sys
 import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -570,6 +571,15 @@ class TestSoftReloadMissingDotenv:
             lifecycle._do_soft_reload(None)
         assert any("no dotenv path recorded" in r.getMessage() for r in caplog.records)
 
+    def test_drops_cached_sdk_clients(self):
+        from zscaler_mcp import client as client_module
+
+        session = MagicMock()
+        client_module._client_cache[("sentinel",)] = (object(), session)
+        lifecycle._do_soft_reload(None)
+        assert client_module._client_cache == {}
+        session.close.assert_called_once()
+
 
 class TestFormatUptime:
     @pytest.mark.parametrize(
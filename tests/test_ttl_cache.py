@@ -0,0 +1,66 @@
+"""Tests for the in-process TTL cache used by slow-changing read tools."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from zscaler_mcp.common.ttl_cache import TTLCache, clear_all_caches
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def test_hit_skips_fetch_and_returns_copy(self):
+        cache = TTLCache(ttl=60)
+        fetch = MagicMock(return_value=[{"id": 1}])
+
+        first = cache.get_or_fetch("k", fetch)
+        first[0]["id"] = 99
+        second = cache.get_or_fetch("k", fetch)
+
+        self.assertEqual(second, [{"id": 1}])
+        fetch.assert_called_once()
+
+    def test_bypass_refetches(self):
+        cache = TTLCache(ttl=60)
+        fetch = MagicMock(return_value="v")
+        cache.get_or_fetch("k", fetch)
+        cache.get_or_fetch("k", fetch, bypass=True)
+        self.assertEqual(fetch.call_count, 2)
+
+    @patch("zscaler_mcp.common.ttl_cache.time.monotonic")
+    def test_expired_entries_are_refetched_and_purged(self, mock_now):
+        cache = TTLCache(ttl=10)
+        mock_now.return_value = 100.0
+        cache.get_or_fetch("a", lambda: 1)
+        cache.get_or_fetch("b", lambda: 2)
+
+        mock_now.return_value = 111.0
+        fetch = MagicMock(return_value=3)
+        self.assertEqual(cache.get_or_fetch("a", fetch), 3)
+        fetch.assert_called_once()
+        self.assertEqual(len(cache), 1)
+
+    def test_size_is_bounded(self):
+        cache = TTLCache(ttl=60, maxsize=3)
+        for i in range(5):
+            cache.get_or_fetch(i, lambda i=i: i)
+        self.assertEqual(len(cache), 3)
+        fetch = MagicMock(return_value="refetched")
+        self.assertEqual(cache.get_or_fetch(0, fetch), "refetched")
+
+    def test_fetch_error_is_not_cached(self):
+        cache = TTLCache(ttl=60)
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch("k", MagicMock(side_effect=RuntimeError("boom")))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear_all_caches(self):
+        first, second = TTLCache(ttl=60), TTLCache(ttl=60)
+        first.get_or_fetch("k", lambda: 1)
+        second.get_or_fetch("k", lambda: 2)
+        clear_all_caches()
+        self.assertEqual((len(first), len(second)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from zscaler_mcp.common.errors import ZscalerToolError
 from zscaler_mcp.tools.zia.rule_labels import (
     zia_create_rule_label,
     zia_delete_rule_label,
@@ -82,7 +83,7 @@ class TestZiaListRuleLabels:
 
         # Verify
         mock_get_client.assert_called_once_with(service="zia")
-        mock_client.zia.rule_labels.list_labels.assert_called_once_with(query_params={})
+        mock_client.zia.rule_labels.list_labels.assert_called_once_with(query_params=None)
         assert len(result) == 3
         assert result[0]["name"] == "Label 0"
         assert result[1]["name"] == "Label 1"
@@ -111,9 +112,10 @@ class TestZiaListRuleLabels:
         mock_client.zia.rule_labels.list_labels.return_value = (None, None, "API Error")
 
         # Execute & Verify
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(ZscalerToolError) as exc_info:
             zia_list_rule_labels()
-        assert "List failed: API Error" in str(exc_info.value)
+        assert "Failed to list rule labels: API Error" in str(exc_info.value)
+        assert exc_info.value.err == "API Error"
 
 
 class TestZiaGetRuleLabel:
@@ -146,7 +148,7 @@ class TestZiaGetRuleLabel:
         # Execute & Verify
         with pytest.raises(Exception) as exc_info:
             zia_get_rule_label(label_id=99999)
-        assert "Read failed: Not Found" in str(exc_info.value)
+        assert "Failed to retrieve rule label 99999: Not Found" in str(exc_info.value)
 
     def test_get_label_missing_id(self):
         """Test getting label without providing label_id."""
@@ -206,7 +208,7 @@ class TestZiaCreateRuleLabel:
         # Execute & Verify
         with pytest.raises(Exception) as exc_info:
             zia_create_rule_label(name="Test Label")
-        assert "Create failed: Creation Failed" in str(exc_info.value)
+        assert "Failed to create rule label: Creation Failed" in str(exc_info.value)
 
     def test_create_label_missing_name(self):
         """Test creating label without required name."""
@@ -296,7 +298,7 @@ class TestZiaUpdateRuleLabel:
         # Execute & Verify
         with pytest.raises(Exception) as exc_info:
             zia_update_rule_label(label_id=12345, name="Updated Name")
-        assert "Update failed: Update Failed" in str(exc_info.value)
+        assert "Failed to update rule label 12345: Update Failed" in str(exc_info.value)
 
 
 class TestZiaDeleteRuleLabel:
@@ -334,7 +336,7 @@ class TestZiaDeleteRuleLabel:
         with patch.dict(os.environ, {"ZSCALER_MCP_SKIP_CONFIRMATIONS": "true"}):
             with pytest.raises(Exception) as exc_info:
                 zia_delete_rule_label(label_id=12345)
-        assert "Delete failed: Delete Failed" in str(exc_info.value)
+        assert "Failed to delete rule label 12345: Delete Failed" in str(exc_info.value)
 
     def test_delete_label_missing_id(self):
         """Test deleting label without label_id — confirmation message shown first."""
@@ -409,6 +409,23 @@ class TestZiaIpDestinationGroups:
         result = zia_list_ip_destination_groups()
         assert len(result) == 1
 
+    @patch("zscaler_mcp.tools.zia.ip_destination_groups.get_zscaler_client")
+    def test_create_ip_destination_group_validates_only_dstn_ip(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ip_destination_groups import zia_create_ip_destination_group
+
+        mock_client = MagicMock()
+        group = _mock_obj({"id": "dg1", "name": "Blocked"})
+        mock_client.zia.cloud_firewall.add_ip_destination_group.return_value = (group, None, None)
+        mock_get_client.return_value = mock_client
+
+        with pytest.raises(ValueError, match="not-an-ip"):
+            zia_create_ip_destination_group(name="Blocked", type="DSTN_IP", addresses=["not-an-ip"])
+
+        zia_create_ip_destination_group(
+            name="Blocked", type="DSTN_FQDN", addresses=["www.example.com"]
+        )
+        mock_client.zia.cloud_firewall.add_ip_destination_group.assert_called_once()
+
     @patch("zscaler_mcp.tools.zia.ip_destination_groups.get_zscaler_client")
     def test_get_ip_destination_group(self, mock_get_client):
         from zscaler_mcp.tools.zia.ip_destination_groups import zia_get_ip_destination_group
@@ -441,6 +458,26 @@ class TestZiaIpSourceGroups:
         result = zia_list_ip_source_groups()
         assert len(result) == 1
 
+    @patch("zscaler_mcp.tools.zia.ip_source_groups.get_zscaler_client")
+    def test_list_ip_source_groups_lite(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ip_source_groups import zia_list_ip_source_groups
+
+        mock_client = MagicMock()
+        groups = [_mock_obj({"id": "sg1", "name": "Office IPs"})]
+        mock_client.zia.cloud_firewall.list_ip_source_groups_lite.return_value = (
+            groups,
+            None,
+            None,
+        )
+        mock_get_client.return_value = mock_client
+
+        result = zia_list_ip_source_groups(search="Office", lite=True)
+        assert result == [{"id": "sg1", "name": "Office IPs"}]
+        mock_client.zia.cloud_firewall.list_ip_source_groups_lite.assert_called_once_with(
+            query_params={"search": "Office"}
+        )
+        mock_client.zia.cloud_firewall.list_ip_source_groups.assert_not_called()
+
     @patch("zscaler_mcp.tools.zia.ip_source_groups.get_zscaler_client")
     def test_get_ip_source_group(self, mock_get_client):
         from zscaler_mcp.tools.zia.ip_source_groups import zia_get_ip_source_group
@@ -453,6 +490,50 @@ class TestZiaIpSourceGroups:
         result = zia_get_ip_source_group(group_id="sg1")
         assert result["name"] == "Office IPs"
 
+    @patch("zscaler_mcp.tools.zia.ip_source_groups.get_zscaler_client")
+    def test_create_ip_source_group_accepts_ips_cidrs_and_ranges(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ip_source_groups import zia_create_ip_source_group
+
+        mock_client = MagicMock()
+        group = _mock_obj({"id": "sg1", "name": "Office IPs"})
+        mock_client.zia.cloud_firewall.add_ip_source_group.return_value = (group, None, None)
+        mock_get_client.return_value = mock_client
+
+        addresses = ["192.168.1.1", "10.0.0.0/24", "10.1.1.1-10.1.1.20", "2001:db8::/32"]
+        zia_create_ip_source_group(name="Office IPs", ip_addresses=addresses)
+        kwargs = mock_client.zia.cloud_firewall.add_ip_source_group.call_args.kwargs
+        assert kwargs["ip_addresses"] == addresses
+
+    @patch("zscaler_mcp.tools.zia.ip_source_groups.get_zscaler_client")
+    def test_create_ip_source_group_rejects_invalid_entries(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ip_source_groups import zia_create_ip_source_group
+
+        with pytest.raises(ValueError) as exc_info:
+            zia_create_ip_source_group(
+                name="Office IPs",
+                ip_addresses='["10.0.0.1", "10.0.0.300", "10.0.0.9-10.0.0.2"]',
+            )
+        assert "10.0.0.300" in str(exc_info.value)
+        assert "10.0.0.9-10.0.0.2" in str(exc_info.value)
+        mock_get_client.assert_not_called()
+
+    @patch("zscaler_mcp.tools.zia.ip_source_groups.get_zscaler_client")
+    def test_update_ip_source_group_drops_duplicate_addresses(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ip_source_groups import zia_update_ip_source_group
+
+        mock_client = MagicMock()
+        group = _mock_obj({"id": "sg1", "name": "Office IPs"})
+        mock_client.zia.cloud_firewall.update_ip_source_group.return_value = (group, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_update_ip_source_group(
+            group_id="sg1",
+            name="Office IPs",
+            ip_addresses=["10.0.0.2", "10.0.0.1", "10.0.0.2"],
+        )
+        kwargs = mock_client.zia.cloud_firewall.update_ip_source_group.call_args.kwargs
+        assert kwargs["ip_addresses"] == ["10.0.0.2", "10.0.0.1"]
+
 
 # ============================================================================
 # NETWORK SERVICES
@@ -528,6 +609,55 @@ class TestZiaLocationManagement:
         with pytest.raises(Exception):
             zia_list_locations()
 
+    @patch("zscaler_mcp.tools.zia.location_management.get_zscaler_client")
+    def test_create_location_from_json_string(self, mock_get_client):
+        from zscaler_mcp.tools.zia.location_management import zia_create_location
+
+        mock_client = MagicMock()
+        loc = _mock_obj({"id": "l1", "name": "HQ"})
+        mock_client.zia.locations.add_location.return_value = (loc, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_create_location(location='{"name": "HQ", "vpnCredentials": [{"id": 1}]}')
+        mock_client.zia.locations.add_location.assert_called_once_with(
+            name="HQ", vpnCredentials=[{"id": 1}]
+        )
+
+    def test_create_location_requires_ip_or_vpn_credentials(self):
+        from zscaler_mcp.tools.zia.location_management import zia_create_location
+
+        with pytest.raises(ValueError, match="ipAddresses` or `vpnCredentials"):
+            zia_create_location(location={"name": "HQ"})
+
+    def test_update_location_rejects_non_object_json(self):
+        from zscaler_mcp.tools.zia.location_management import zia_update_location
+
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            zia_update_location(location_id=1, location='["HQ"]')
+
+
+class TestZiaNetworkAppGroups:
+
+    @patch("zscaler_mcp.tools.zia.network_app_groups.get_zscaler_client")
+    def test_create_accepts_json_string(self, mock_get_client):
+        from zscaler_mcp.tools.zia.network_app_groups import zia_create_network_app_group
+
+        mock_client = MagicMock()
+        group = _mock_obj({"id": "n1", "name": "Web"})
+        mock_client.zia.cloud_firewall.add_network_app_group.return_value = (group, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_create_network_app_group(name="Web", network_applications='["HTTP", "HTTPS"]')
+        mock_client.zia.cloud_firewall.add_network_app_group.assert_called_once_with(
+            name="Web", description=None, network_applications=["HTTP", "HTTPS"]
+        )
+
+    def test_create_rejects_invalid_json(self):
+        from zscaler_mcp.tools.zia.network_app_groups import zia_create_network_app_group
+
+        with pytest.raises(ValueError, match="Invalid JSON for network_applications"):
+            zia_create_network_app_group(name="Web", network_applications="[HTTP")
+
 
 # ============================================================================
 # DLP DICTIONARIES
@@ -536,6 +666,14 @@ class TestZiaLocationManagement:
 
 class TestZiaDlpDictionaries:
 
+    @pytest.fixture(autouse=True)
+    def _clear_dictionary_cache(self):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import _dict_cache
+
+        _dict_cache.clear()
+        yield
+        _dict_cache.clear()
+
     @patch("zscaler_mcp.tools.zia.list_dlp_dictionaries.get_zscaler_client")
     def test_list_dlp_dictionaries(self, mock_get_client):
         from zscaler_mcp.tools.zia.list_dlp_dictionaries import zia_dlp_dictionary_manager
@@ -572,6 +710,133 @@ class TestZiaDlpDictionaries:
         result = zia_dlp_dictionary_manager(action="read_lite")
         assert len(result) == 1
 
+    @patch("zscaler_mcp.tools.zia.list_dlp_dictionaries.get_zscaler_client")
+    def test_repeated_reads_are_served_from_cache(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import zia_dlp_dictionary_manager
+
+        mock_client = MagicMock()
+        dicts = [_mock_obj({"id": "d1", "name": "SSN"})]
+        mock_client.zia.dlp_dictionary.list_dicts.return_value = (dicts, None, None)
+        mock_get_client.return_value = mock_client
+
+        first = zia_dlp_dictionary_manager(action="read", search="SSN")
+        first[0]["name"] = "mutated by caller"
+        second = zia_dlp_dictionary_manager(action="read", search="SSN")
+
+        assert second == [{"id": "d1", "name": "SSN"}]
+        mock_client.zia.dlp_dictionary.list_dicts.assert_called_once()
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_dictionaries.get_zscaler_client")
+    def test_cache_is_not_shared_across_clients(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import zia_dlp_dictionary_manager
+
+        tenant_a, tenant_b = MagicMock(), MagicMock()
+        tenant_a.zia.dlp_dictionary.list_dicts.return_value = ([_mock_obj({"id": "a"})], None, None)
+        tenant_b.zia.dlp_dictionary.list_dicts.return_value = ([_mock_obj({"id": "b"})], None, None)
+
+        mock_get_client.return_value = tenant_a
+        assert zia_dlp_dictionary_manager(action="read") == [{"id": "a"}]
+        mock_get_client.return_value = tenant_b
+        assert zia_dlp_dictionary_manager(action="read") == [{"id": "b"}]
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_dictionaries.get_zscaler_client")
+    def test_bypass_cache_refetches(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import zia_dlp_dictionary_manager
+
+        mock_client = MagicMock()
+        dicts = [_mock_obj({"id": "d1", "name": "SSN"})]
+        mock_client.zia.dlp_dictionary.list_dicts.return_value = (dicts, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_dlp_dictionary_manager(action="read")
+        zia_dlp_dictionary_manager(action="read", bypass_cache=True)
+        assert mock_client.zia.dlp_dictionary.list_dicts.call_count == 2
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_dictionaries.get_zscaler_client")
+    def test_query_projects_cached_results(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_dictionaries import zia_dlp_dictionary_manager
+
+        mock_client = MagicMock()
+        dicts = [_mock_obj({"id": "d1", "name": "SSN", "phrases": ["ssn"]})]
+        mock_client.zia.dlp_dictionary.list_dicts.return_value = (dicts, None, None)
+        mock_get_client.return_value = mock_client
+
+        projected = zia_dlp_dictionary_manager(action="read", query="[].{id: id, name: name}")
+        full = zia_dlp_dictionary_manager(action="read")
+
+        assert projected == [{"id": "d1", "name": "SSN"}]
+        assert full[0]["phrases"] == ["ssn"]
+        mock_client.zia.dlp_dictionary.list_dicts.assert_called_once()
+
+
+# ============================================================================
+# DLP ENGINES
+# ============================================================================
+
+
+class TestZiaDlpEngines:
+
+    @pytest.fixture(autouse=True)
+    def _clear_engine_cache(self):
+        from zscaler_mcp.tools.zia.list_dlp_engines import _engine_cache
+
+        _engine_cache.clear()
+        yield
+        _engine_cache.clear()
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_engines.get_zscaler_client")
+    def test_list_dlp_engines(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_engines import zia_dlp_engine_manager
+
+        mock_client = MagicMock()
+        engines = [_mock_obj({"id": "e1", "name": "PCI"}), _mock_obj({"id": "e2", "name": "HIPAA"})]
+        mock_client.zia.dlp_engine.list_dlp_engines.return_value = (engines, None, None)
+        mock_get_client.return_value = mock_client
+
+        result = zia_dlp_engine_manager(action="read")
+        assert len(result) == 2
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_engines.get_zscaler_client")
+    def test_repeated_reads_are_served_from_cache(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_engines import zia_dlp_engine_manager
+
+        mock_client = MagicMock()
+        engine = _mock_obj({"id": "e1", "name": "PCI"})
+        mock_client.zia.dlp_engine.get_dlp_engines.return_value = (engine, None, None)
+        mock_get_client.return_value = mock_client
+
+        first = zia_dlp_engine_manager(action="read", engine_id="e1")
+        first["name"] = "mutated by caller"
+        second = zia_dlp_engine_manager(action="read", engine_id="e1")
+
+        assert second == {"id": "e1", "name": "PCI"}
+        mock_client.zia.dlp_engine.get_dlp_engines.assert_called_once()
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_engines.get_zscaler_client")
+    def test_bypass_cache_refetches(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_dlp_engines import zia_dlp_engine_manager
+
+        mock_client = MagicMock()
+        engines = [_mock_obj({"id": "e1", "name": "PCI"})]
+        mock_client.zia.dlp_engine.list_dlp_engines_lite.return_value = (engines, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_dlp_engine_manager(action="read_lite")
+        zia_dlp_engine_manager(action="read_lite", bypass_cache=True)
+        assert mock_client.zia.dlp_engine.list_dlp_engines_lite.call_count == 2
+
+    @patch("zscaler_mcp.tools.zia.list_dlp_engines.get_zscaler_client")
+    def test_sdk_error_raises_tool_error(self, mock_get_client):
+        from zscaler_mcp.common.errors import ZscalerToolError
+        from zscaler_mcp.tools.zia.list_dlp_engines import zia_dlp_engine_manager
+
+        mock_client = MagicMock()
+        mock_client.zia.dlp_engine.get_dlp_engines.return_value = (None, None, "API Error")
+        mock_get_client.return_value = mock_client
+
+        with pytest.raises(ZscalerToolError, match="Failed to retrieve engine e1: API Error"):
+            zia_dlp_engine_manager(action="read", engine_id="e1")
+
 
 # ============================================================================
 # WEB DLP RULES
@@ -647,6 +912,44 @@ class TestZiaUserManagement:
         result = zia_users_manager(action="read", user_id="u1")
         assert result["name"] == "Alice"
 
+    @patch("zscaler_mcp.tools.zia.list_users.get_zscaler_client")
+    def test_list_users_with_query(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_users import zia_users_manager
+
+        mock_client = MagicMock()
+        users = [
+            _mock_obj({"id": "u1", "name": "Alice", "email": "alice@example.com"}),
+            _mock_obj({"id": "u2", "name": "Bob", "email": "bob@example.com"}),
+        ]
+        mock_client.zia.user_management.list_users.return_value = (users, None, None)
+        mock_get_client.return_value = mock_client
+
+        result = zia_users_manager(action="read", query="[].name")
+        assert result == ["Alice", "Bob"]
+
+    @patch("zscaler_mcp.tools.zia.list_users.get_zscaler_client")
+    def test_list_users_sends_only_provided_filters(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_users import zia_users_manager
+
+        mock_client = MagicMock()
+        mock_client.zia.user_management.list_users.return_value = ([], None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_users_manager(action="read", dept="Finance", page_size=50)
+        mock_client.zia.user_management.list_users.assert_called_once_with(
+            query_params={"dept": "Finance", "page_size": 50}
+        )
+
+    @patch("zscaler_mcp.tools.zia.list_users.get_zscaler_client")
+    def test_list_users_rejects_out_of_range_page_size(self, mock_get_client):
+        from zscaler_mcp.tools.zia.list_users import zia_users_manager
+
+        with pytest.raises(ValueError, match="positive integer"):
+            zia_users_manager(action="read", page_size=0)
+        with pytest.raises(ValueError, match="cannot exceed 1000"):
+            zia_users_manager(action="read", page_size=1001)
+        mock_get_client.return_value.zia.user_management.list_users.assert_not_called()
+
 
 class TestZiaUserGroups:
 
@@ -751,6 +1054,126 @@ class TestZiaGreTunnels:
         result = zia_list_gre_tunnels()
         assert len(result) == 1
 
+    @patch("zscaler_mcp.tools.zia.gre_tunnels.get_zscaler_client")
+    def test_create_gre_tunnel_omits_unset_fields(self, mock_get_client):
+        from zscaler_mcp.tools.zia.gre_tunnels import zia_create_gre_tunnel
+
+        mock_client = MagicMock()
+        static_ip = MagicMock(ip_address="5.6.7.8")
+        mock_client.zia.traffic_static_ip.list_static_ips.return_value = ([static_ip], None, None)
+        mock_client.zia.gre_tunnel.list_gre_ranges.return_value = (
+            [{"startIPAddress": "172.17.0.0"}],
+            None,
+            None,
+        )
+        mock_client.zia.gre_tunnel.add_gre_tunnel.return_value = (
+            _mock_obj({"id": "t1", "sourceIp": "5.6.7.8"}),
+            None,
+            None,
+        )
+        mock_get_client.return_value = mock_client
+
+        zia_create_gre_tunnel(static_ip_address="5.6.7.8")
+        mock_client.zia.gre_tunnel.add_gre_tunnel.assert_called_once_with(
+            source_ip="5.6.7.8", internal_ip_range="172.17.0.0"
+        )
+
+
+# ============================================================================
+# SSL INSPECTION RULES
+# ============================================================================
+
+
+class TestZiaSslInspection:
+
+    @patch("zscaler_mcp.tools.zia.ssl_inspection.get_zscaler_client")
+    def test_list_ssl_inspection_rules_with_search_and_query(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ssl_inspection import zia_list_ssl_inspection_rules
+
+        mock_client = MagicMock()
+        rules = [_mock_obj({"id": 1, "name": "Banking"}), _mock_obj({"id": 2, "name": "Bank HR"})]
+        mock_client.zia.ssl_inspection_rules.list_rules.return_value = (rules, None, None)
+        mock_get_client.return_value = mock_client
+
+        result = zia_list_ssl_inspection_rules(search="Bank", query="[].name")
+        assert result == ["Banking", "Bank HR"]
+        mock_client.zia.ssl_inspection_rules.list_rules.assert_called_once_with(
+            query_params={"search": "Bank"}
+        )
+
+    @patch("zscaler_mcp.tools.zia.ssl_inspection.get_zscaler_client")
+    def test_get_ssl_inspection_rule_error(self, mock_get_client):
+        from zscaler_mcp.common.errors import ZscalerToolError
+        from zscaler_mcp.tools.zia.ssl_inspection import zia_get_ssl_inspection_rule
+
+        mock_client = MagicMock()
+        mock_client.zia.ssl_inspection_rules.get_rule.return_value = (None, None, "Not found")
+        mock_get_client.return_value = mock_client
+
+        with pytest.raises(ZscalerToolError) as exc_info:
+            zia_get_ssl_inspection_rule(rule_id=42)
+        assert exc_info.value.err == "Not found"
+        assert str(exc_info.value) == "Failed to retrieve SSL inspection rule 42: Not found"
+
+    def test_build_payload_skips_none_and_parses_lists(self):
+        from zscaler_mcp.tools.zia.ssl_inspection import _build_ssl_inspection_rule_payload
+
+        payload = _build_ssl_inspection_rule_payload(
+            name="Bypass Banking",
+            enabled=True,
+            rank=7,
+            groups="[1, 2]",
+            platforms=["SCAN_IOS"],
+            predefined=False,
+        )
+        assert payload == {
+            "name": "Bypass Banking",
+            "enabled": True,
+            "rank": 7,
+            "platforms": ["SCAN_IOS"],
+            "groups": [1, 2],
+            "predefined": False,
+        }
+
+    def test_build_payload_empty(self):
+        from zscaler_mcp.tools.zia.ssl_inspection import _build_ssl_inspection_rule_payload
+
+        assert _build_ssl_inspection_rule_payload() == {}
+
+    def test_build_payload_parses_action_json(self):
+        from zscaler_mcp.tools.zia.ssl_inspection import _build_ssl_inspection_rule_payload
+
+        payload = _build_ssl_inspection_rule_payload(action='{"type": "DO_NOT_DECRYPT"}')
+        assert payload == {"action": {"type": "DO_NOT_DECRYPT"}}
+
+    def test_build_payload_invalid_action_json(self):
+        from zscaler_mcp.tools.zia.ssl_inspection import _build_ssl_inspection_rule_payload
+
+        with pytest.raises(ValueError, match="Invalid JSON string for action"):
+            _build_ssl_inspection_rule_payload(action="{type: BLOCK")
+
+    @patch("zscaler_mcp.tools.zia.ssl_inspection.get_zscaler_client")
+    def test_create_rejects_long_name(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ssl_inspection import zia_create_ssl_inspection_rule
+
+        with pytest.raises(ValueError, match="31 characters or fewer"):
+            zia_create_ssl_inspection_rule(name="x" * 32, action={"type": "DECRYPT"})
+        mock_get_client.assert_not_called()
+
+    @patch("zscaler_mcp.tools.zia.ssl_inspection.get_zscaler_client")
+    def test_update_without_name_backfills(self, mock_get_client):
+        from zscaler_mcp.tools.zia.ssl_inspection import zia_update_ssl_inspection_rule
+
+        mock_client = MagicMock()
+        ssl = mock_client.zia.ssl_inspection_rules
+        existing = _mock_obj({"id": 5, "name": "Existing", "order": 2})
+        ssl.get_rule.return_value = (existing, None, None)
+        ssl.update_rule.return_value = (existing, None, None)
+        mock_get_client.return_value = mock_client
+
+        zia_update_ssl_inspection_rule(rule_id=5, enabled=False)
+        ssl.update_rule.assert_called_once_with(5, name="Existing", order=2, enabled=False)
+
 
 # ============================================================================
 # SANDBOX
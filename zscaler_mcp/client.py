@@ -9,15 +9,40 @@ of credentials:
     - ``ZSCALER_VANITY_DOMAIN``
     - ``ZSCALER_CUSTOMER_ID`` (required when calling ZPA tools)
     - ``ZSCALER_CLOUD`` (optional; defaults to production)
+
+The SDK retries 429/503/504 responses (and a busy ZIA edit lock) on its own,
+honouring ``Retry-After``. ``ZSCALER_MCP_MAX_RETRIES`` and
+``ZSCALER_MCP_MAX_RETRY_SECONDS`` tune how many attempts it makes and the
+longest back-off it will wait for.
+
+Clients are cached per resolved configuration, so repeated tool calls reuse
+the same SDK client and its HTTP session instead of constructing new ones.
+OAuth tokens are not managed here: the SDK shares one token holder between
+clients built from an equal config, with or without this cache. Changing any
+credential produces a new cache key, which keeps credential rotation working
+without a restart; :func:`clear_client_cache` drops every cached client (used
+by the SIGHUP soft reload) along with the tool-level read caches in
+:mod:`zscaler_mcp.common.ttl_cache`.
+
+Each cached client gets its own ``requests.Session`` so calls reuse pooled
+keep-alive connections instead of opening a new TCP/TLS connection per
+request. ``ZSCALER_MCP_HTTP_POOL_SIZE`` sets how many connections per host
+the pool keeps open (default 10); raise it when many tool calls run
+concurrently.
 """
 
+import json
 import logging
 import os
+import threading
 import warnings
 
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from zscaler import ZscalerClient
 
+from .common.ttl_cache import clear_all_caches
 from .utils.utils import get_combined_user_agent
 
 # Suppress SyntaxWarnings emitted by the upstream zscaler SDK DLP modules.
@@ -26,6 +51,16 @@ warnings.filterwarnings("ignore", category=SyntaxWarning, module="zscaler.zia.dl
 
 logger = logging.getLogger(__name__)
 
+# Cache of live OneAPI clients keyed by their resolved config, stored as
+# ``(client, session)`` so the session can be closed when the client is
+# dropped. Bounded so a long-running server that sees many credential sets
+# cannot grow it forever.
+_CLIENT_CACHE_MAX = 8
+_client_cache: dict = {}
+_client_cache_lock = threading.Lock()
+
+_DEFAULT_HTTP_POOL_SIZE = 10
+
 
 def _required(value, env_name):
     """Resolve a credential value, falling back to the environment."""
@@ -34,6 +69,30 @@ def _required(value, env_name):
     return os.getenv(env_name)
 
 
+def _env_int(env_name: str, minimum: int = 0):
+    """Read an optional integer setting from the environment."""
+    raw = os.getenv(env_name)
+    if raw is None or not raw.strip():
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{env_name} must be an integer, got {raw!r}.") from None
+    if value < minimum:
+        raise ValueError(f"{env_name} must be >= {minimum}, got {value}.")
+    return value
+
+
+def _build_session() -> requests.Session:
+    """Create the keep-alive HTTP session shared by one cached client."""
+    pool_size = _env_int("ZSCALER_MCP_HTTP_POOL_SIZE", minimum=1) or _DEFAULT_HTTP_POOL_SIZE
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def get_zscaler_client(
     *,
     client_id: str = None,
@@ -67,11 +126,14 @@ def get_zscaler_client(
             ``ZSCALER_MCP_USER_AGENT_COMMENT``.
 
     Returns:
-        An authenticated :class:`zscaler.ZscalerClient` instance.
+        An authenticated :class:`zscaler.ZscalerClient` instance. Calls that
+        resolve to the same configuration return the same cached instance.
 
     Raises:
         RuntimeError: when one or more required OneAPI credentials are missing.
-        ValueError: when neither ``client_secret`` nor ``private_key`` is provided.
+        ValueError: when neither ``client_secret`` nor ``private_key`` is provided,
+            or when a retry or pool setting in the environment is not a valid
+            integer.
     """
     load_dotenv()
 
@@ -106,7 +168,6 @@ def get_zscaler_client(
         )
 
     custom_user_agent = get_combined_user_agent(user_agent_comment)
-    logger.debug("[client] OneAPI client init (service=%s, ua=%s)", service, custom_user_agent)
 
     config = {
         "clientId": client_id,
@@ -122,4 +183,46 @@ def get_zscaler_client(
     if private_key:
         config["privateKey"] = private_key
 
-    return ZscalerClient(config)
+    rate_limit = {}
+    max_retries = _env_int("ZSCALER_MCP_MAX_RETRIES")
+    if max_retries is not None:
+        rate_limit["maxRetries"] = max_retries
+    max_retry_seconds = _env_int("ZSCALER_MCP_MAX_RETRY_SECONDS", minimum=1)
+    if max_retry_seconds is not None:
+        rate_limit["maxRetrySeconds"] = max_retry_seconds
+    if rate_limit:
+        config["rateLimit"] = rate_limit
+
+    cache_key = json.dumps(config, sort_keys=True)
+    evicted = None
+    with _client_cache_lock:
+        entry = _client_cache.get(cache_key)
+        if entry is None:
+            logger.debug(
+                "[client] OneAPI client init (service=%s, ua=%s)", service, custom_user_agent
+            )
+            session = _build_session()
+            client = ZscalerClient(config)
+            client.get_request_executor().set_session(session)
+            if len(_client_cache) >= _CLIENT_CACHE_MAX:
+                evicted = _client_cache.pop(next(iter(_client_cache)))
+            entry = _client_cache[cache_key] = (client, session)
+    if evicted is not None:
+        evicted[1].close()
+        clear_all_caches()
+    return entry[0]
+
+
+def clear_client_cache() -> None:
+    """Drop every cached OneAPI client and every cached tool read result.
+
+    Each dropped client's HTTP session is closed, releasing its pooled
+    connections. The next :func:`get_zscaler_client` call builds a fresh
+    client.
+    """
+    with _client_cache_lock:
+        entries = list(_client_cache.values())
+        _client_cache.clear()
+    for _, session in entries:
+        session.close()
+    clear_all_caches()
@@ -19,13 +19,15 @@ The server secret is generated once at process startup (ephemeral, never stored)
 Tokens expire after CONFIRMATION_TOKEN_TTL_SECONDS (default: 5 minutes).
 """
 
+import functools
 import hashlib
 import hmac
+import inspect
 import json
 import os
 import secrets
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from zscaler_mcp.common.logging import get_logger
 
@@ -249,3 +251,38 @@ def check_confirmation(tool_name: str, confirmed: Any, params: Dict[str, Any]) -
 
     logger.info("Confirmed (token valid): %s", tool_name)
     return None
+
+
+def requires_confirmation(*id_params: str) -> Callable[[Callable], Callable]:
+    """Gate a write tool behind :func:`check_confirmation`.
+
+    The wrapped tool must accept a ``kwargs`` parameter (the hidden carrier
+    for ``confirmation_token``). The token is bound to the tool's function
+    name and to the stringified values of ``id_params``. When confirmation
+    is still required the confirmation message is returned and the tool body
+    is not run.
+
+    Example::
+
+        @requires_confirmation("location_id")
+        def zia_delete_location(location_id, service="zia", kwargs="{}"): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        sig = inspect.signature(func)
+        tool_name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            confirmed = extract_confirmed_from_kwargs(bound.arguments.get("kwargs"))
+            params = {name: str(bound.arguments[name]) for name in id_params}
+            message = check_confirmation(tool_name, confirmed, params)
+            if message:
+                return message
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,60 @@
+"""
+Typed errors raised by MCP tools.
+
+Tools surface SDK failures as :class:`ZscalerToolError` rather than a bare
+``Exception``. The class keeps the failed operation and the underlying SDK
+error as attributes, so callers can branch on them without parsing the
+message. The message keeps the historical ``"Failed to <op>: <err>"`` shape
+and is only rendered when the exception is actually printed.
+
+:func:`check_result` unpacks the SDK's ``(result, response, error)`` tuple
+and raises :class:`ZscalerToolError` on error, replacing the
+``if err: raise ...`` block after each call.
+"""
+
+from typing import Any, Tuple
+
+__all__ = ["ZscalerToolError", "check_result"]
+
+
+class ZscalerToolError(Exception):
+    """An SDK call made by a tool returned an error.
+
+    Args:
+        op: Short description of the failed operation, phrased to follow
+            "Failed to" (e.g. ``"add cloud firewall rule"``).
+        err: The error returned by the SDK. When it is an exception it is
+            also recorded as ``__cause__`` so tracebacks keep the chain.
+    """
+
+    __slots__ = ("op", "err")
+
+    def __init__(self, op: str, err: Any) -> None:
+        super().__init__(op, err)
+        self.op = op
+        self.err = err
+        if isinstance(err, BaseException):
+            self.__cause__ = err
+
+    def __str__(self) -> str:
+        return f"Failed to {self.op}: {self.err}"
+
+
+def check_result(result: Tuple[Any, Any, Any], op: str) -> Any:
+    """Unpack an SDK ``(result, response, error)`` tuple.
+
+    Args:
+        result: The tuple returned by an SDK call.
+        op: Operation description for the error message, phrased to follow
+            "Failed to" (e.g. ``"list IP source groups"``).
+
+    Raises:
+        ZscalerToolError: if the SDK returned an error.
+
+    Returns:
+        The result element of the tuple.
+    """
+    data, _, err = result
+    if err:
+        raise ZscalerToolError(op, err)
+    return data
@@ -0,0 +1,86 @@
+"""
+Short-lived in-process cache for slow-changing read results.
+
+Some ZIA reference data (DLP dictionaries, DLP engines) is listed far more
+often than it changes. A module-level :class:`TTLCache` lets a tool serve
+repeated identical reads from memory for a few minutes instead of making
+another API round trip.
+
+Callers put the SDK client in the key (``(client, ...)``), so two credential
+sets never share entries. Every cache registers itself, and
+:func:`zscaler_mcp.client.clear_client_cache` (SIGHUP soft reload) and client
+eviction call :func:`clear_all_caches`. After a credential or tenant change,
+no cache keeps serving the previous tenant's data.
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+__all__ = ["TTLCache", "clear_all_caches"]
+
+_caches: List["TTLCache"] = []
+_caches_lock = threading.Lock()
+
+
+class TTLCache:
+    """Thread-safe ``key -> value`` cache whose entries expire after ``ttl`` seconds.
+
+    Values are deep-copied on the way out, so callers may mutate what they
+    get back. Expired entries are purged on every insert. Once ``maxsize``
+    live entries exist, the oldest one is dropped to make room.
+
+    Args:
+        ttl: Seconds an entry stays valid.
+        maxsize: Upper bound on stored entries.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        with _caches_lock:
+            _caches.append(self)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any], bypass: bool = False) -> Any:
+        """Return a copy of the live value for ``key``, calling ``fetch`` on a miss.
+
+        ``fetch`` runs outside the lock. Its result is stored unless it
+        raises. With ``bypass=True`` the stored value is ignored and
+        refreshed.
+        """
+        if not bypass:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return copy.deepcopy(entry[1])
+
+        value = fetch()
+        now = time.monotonic()
+        with self._lock:
+            for stale in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[stale]
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (now + self.ttl, value)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def clear_all_caches() -> None:
+    """Drop every entry from every :class:`TTLCache` in the process."""
+    with _caches_lock:
+        caches = list(_caches)
+    for cache in caches:
+        cache.clear()
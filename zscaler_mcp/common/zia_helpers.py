@@ -9,6 +9,9 @@ Sections:
     2. Cloud-application enum resolver
     3. Cloud-application class (``app_class``) catalog
     4. URL categories (predefined-vs-custom resolution)
+    5. Shared tool parameter types
+    6. IP address list validation
+    7. List pagination
 
 If you need to add a new helper, add a new section with a clear
 ``=========`` header in this file. Only split into a separate module
@@ -18,10 +21,13 @@ helpers don't share, OR (b) this file grows past ~600 lines.
 
 from __future__ import annotations
 
+import ipaddress
 import re
 import threading
 import time
-from typing import Iterable, List, Literal, Optional, Tuple
+from typing import Annotated, Iterable, List, Literal, Optional, Tuple
+
+from pydantic import Field
 
 # ============================================================================
 # 1. Admin rank semantics
@@ -974,6 +980,97 @@ def resolve_predefined_category(
     )
 
 
+# ============================================================================
+# 5. Shared tool parameter types
+# ============================================================================
+#
+# ``Annotated`` aliases for parameters that every ZIA tool declares with
+# the exact same type and description. Tools keep their own default
+# (``service: ServiceParam = "zia"``); only the type and ``Field`` are
+# shared, so one ``FieldInfo`` backs every signature and the generated
+# tool schemas are unchanged.
+
+ServiceParam = Annotated[str, Field(description="The service to use.")]
+
+
+# ============================================================================
+# 6. IP address list validation
+# ============================================================================
+#
+# IP source groups and ``DSTN_IP`` destination groups take a list of
+# addresses, each one a single IP, a CIDR block, or a ``start-end`` range
+# (IPv4 or IPv6). The API rejects the whole request on the first bad
+# entry, so we check every entry locally and report all the bad ones in a
+# single ``ValueError`` before making the call.
+
+
+def _is_valid_ip_entry(entry: str) -> bool:
+    if not isinstance(entry, str) or not entry.strip():
+        return False
+    entry = entry.strip()
+    try:
+        if "-" in entry:
+            start, end = (ipaddress.ip_address(p.strip()) for p in entry.split("-", 1))
+            return start.version == end.version and start <= end
+        ipaddress.ip_network(entry, strict=False)
+    except ValueError:
+        return False
+    return True
+
+
+def validate_ip_addresses(addresses: Iterable[str], field_name: str = "ip_addresses") -> List[str]:
+    """Validate a list of IPs / CIDRs / ``start-end`` ranges.
+
+    Args:
+        addresses: Entries to check (already parsed into a list).
+        field_name: Parameter name used in the error message.
+
+    Raises:
+        ValueError: listing every entry that is not a valid IP address,
+            CIDR block, or ascending same-family range.
+
+    Returns:
+        The entries as a list, unchanged.
+    """
+    addresses = list(addresses)
+    invalid = [a for a in addresses if not _is_valid_ip_entry(a)]
+    if invalid:
+        raise ValueError(
+            f"{field_name} contains invalid entries: {invalid}. Each entry must be an "
+            "IP address (10.0.0.1), a CIDR block (10.0.0.0/24), or a range "
+            "(10.0.0.1-10.0.0.20)."
+        )
+    return addresses
+
+
+# ============================================================================
+# 7. List pagination
+# ============================================================================
+#
+# ZIA list endpoints that take ``page_size`` cap it at 1000 and reject
+# anything outside 1..1000 with a generic 400.
+
+MAX_PAGE_SIZE = 1000
+
+
+def validate_page_size(page_size: Optional[int]) -> Optional[int]:
+    """Validate an optional ``page_size`` against the ZIA bounds.
+
+    Raises:
+        ValueError: if ``page_size`` is not in ``1..MAX_PAGE_SIZE``.
+
+    Returns:
+        ``page_size`` unchanged (``None`` passes through).
+    """
+    if page_size is None:
+        return None
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer")
+    if page_size > MAX_PAGE_SIZE:
+        raise ValueError(f"page_size cannot exceed {MAX_PAGE_SIZE}")
+    return page_size
+
+
 __all__ = [
     # Admin rank
     "DEFAULT_RULE_RANK",
@@ -1001,4 +1098,11 @@ __all__ = [
     "parent_for_app_class",
     # URL categories
     "resolve_predefined_category",
+    # Shared tool parameter types
+    "ServiceParam",
+    # IP address validation
+    "validate_ip_addresses",
+    # List pagination
+    "MAX_PAGE_SIZE",
+    "validate_page_size",
 ]
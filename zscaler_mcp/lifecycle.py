@@ -238,11 +238,11 @@ def install_serve_handlers(state: LifecycleState, dotenv_path: Optional[str]) ->
 def _do_soft_reload(dotenv_path: Optional[str]) -> None:
     """Re-read ``.env`` and refresh env-driven runtime toggles.
 
-    The Zscaler SDK client is created lazily on every tool call (no
-    module-level cache), so once new credentials land in ``os.environ``
-    the next tool call already picks them up. The auth-middleware token
-    cache is keyed by credential hash, so credential changes naturally
-    miss the old entries and re-validate against the new values.
+    The Zscaler SDK client cache is keyed by the resolved credentials,
+    so once new credentials land in ``os.environ`` the next tool call
+    already builds a fresh client. The auth-middleware token cache is
+    keyed by credential hash, so credential changes naturally miss the
+    old entries and re-validate against the new values.
 
     What this function actually does:
 
@@ -250,6 +250,8 @@ def _do_soft_reload(dotenv_path: Optional[str]) -> None:
       stale values get replaced.
     * Re-applies env-driven toggles that are read once at startup
       (currently: ``ZSCALER_MCP_LOG_TOOL_CALLS``).
+    * Drops the cached SDK clients so clients built from the old
+      credentials are not kept alive.
 
     Importing here keeps the lifecycle module free of an upfront
     dependency on the rest of the package, so the CLI subcommands
@@ -284,6 +286,13 @@ def _do_soft_reload(dotenv_path: Optional[str]) -> None:
     except ImportError:
         pass
 
+    try:
+        from zscaler_mcp.client import clear_client_cache
+
+        clear_client_cache()
+    except ImportError:
+        pass
+
 
 # ============================================================================
 # CLI subcommands
@@ -3,9 +3,12 @@ from typing import Annotated, List, Optional, Union
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import ZscalerToolError
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
 from zscaler_mcp.common.zia_helpers import (
     RANK_FIELD_DESCRIPTION,
+    ServiceParam,
     apply_default_order,
     apply_default_rank,
     validate_order,
@@ -13,6 +16,154 @@ from zscaler_mcp.common.zia_helpers import (
 )
 from zscaler_mcp.utils.utils import parse_list
 
+# ============================================================================
+# Shared Parameter Annotations
+# ============================================================================
+#
+# Create and update accept the same optional rule attributes with identical
+# descriptions. Declaring each ``Annotated`` type once keeps the two tool
+# signatures in lockstep and builds a single ``FieldInfo`` per attribute
+# instead of one per tool.
+
+_Description = Annotated[Optional[str], Field(description="Optional rule description.")]
+
+_Enabled = Annotated[Optional[bool], Field(description="True to enable rule, False to disable.")]
+
+_Rank = Annotated[Optional[int], Field(description=RANK_FIELD_DESCRIPTION)]
+
+_SrcIps = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description="Source IPs for the rule. Accepts IP addresses or CIDR. Accepts JSON string or list."
+    ),
+]
+
+_DestAddresses = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description="Destination IPs for the rule. Accepts IP addresses, CIDR, or hostnames. Accepts JSON string or list."
+    ),
+]
+
+_SourceCountries = Annotated[
+    Optional[Union[List[str], str]],
+    Field(description="Source countries for the rule. Accepts JSON string or list."),
+]
+
+_DestCountries = Annotated[
+    Optional[Union[List[str], str]],
+    Field(description="Destination countries for the rule. Accepts JSON string or list."),
+]
+
+_ExcludeSrcCountries = Annotated[
+    Optional[bool], Field(description="Exclude source countries from the rule.")
+]
+
+_DestIpCategories = Annotated[
+    Optional[Union[List[str], str]],
+    Field(description="IP address categories for the rule. Accepts JSON string or list."),
+]
+
+_DeviceTrustLevels = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description="Device trust levels for the rule application. Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST"
+    ),
+]
+
+_NwApplications = Annotated[
+    Optional[Union[List[str], str]],
+    Field(description="Network service applications for the rule. Accepts JSON string or list."),
+]
+
+_EnableFullLogging = Annotated[Optional[bool], Field(description="If True, enables full logging.")]
+
+_Predefined = Annotated[
+    Optional[bool],
+    Field(description="Indicates that the rule is predefined by using a true value."),
+]
+
+_DefaultRule = Annotated[
+    Optional[bool],
+    Field(description="Indicates whether the rule is the Default Cloud IPS Rule or not."),
+]
+
+_AppServices = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for application services for the rule."),
+]
+
+_AppServiceGroups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for app service groups.")
+]
+
+_Departments = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for departments the rule applies to."),
+]
+
+_DestIpGroups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for destination IP groups.")
+]
+
+_DestIpv6Groups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for destination IPV6 groups.")
+]
+
+_Devices = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for devices managed by Zscaler Client Connector."),
+]
+
+_DeviceGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for device groups managed by Zscaler Client Connector."),
+]
+
+_Groups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for groups the rule applies to.")
+]
+
+_Labels = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for labels the rule applies to.")
+]
+
+_Locations = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for locations the rule applies to.")
+]
+
+_LocationGroups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for location groups.")
+]
+
+_NwApplicationGroups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for network application groups.")
+]
+
+_NwServices = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for network services the rule applies to."),
+]
+
+_NwServiceGroups = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for network service groups.")
+]
+
+_TimeWindows = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for time windows the rule applies to."),
+]
+
+_Users = Annotated[
+    Optional[Union[List[int], str]], Field(description="IDs for users the rule applies to.")
+]
+
+_WorkloadGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for workload groups the rule applies to."),
+]
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -133,7 +284,7 @@ def zia_list_cloud_firewall_rules(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[dict]:
     """
     Lists all ZIA Cloud Firewall Rules with optional search filtering.
@@ -164,7 +315,7 @@ def zia_list_cloud_firewall_rules(
     query_params = {"search": search} if search else {}
     rules, _, err = fw.list_rules(query_params=query_params)
     if err:
-        raise Exception(f"Failed to list cloud firewall rules: {err}")
+        raise ZscalerToolError("list cloud firewall rules", err)
     results = [r.as_dict() for r in rules]
     return apply_jmespath(results, query)
 
@@ -173,7 +324,7 @@ def zia_get_cloud_firewall_rule(
     rule_id: Annotated[
         Union[int, str], Field(description="The ID of the cloud firewall rule to retrieve.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Gets a specific ZIA Cloud Firewall Rule by ID.
@@ -195,7 +346,7 @@ def zia_get_cloud_firewall_rule(
 
     rule, _, err = fw.get_rule(rule_id)
     if err:
-        raise Exception(f"Failed to retrieve rule {rule_id}: {err}")
+        raise ZscalerToolError(f"retrieve rule {rule_id}", err)
     return rule.as_dict()
 
 
@@ -221,14 +372,9 @@ def zia_create_cloud_firewall_rule(
             )
         ),
     ],
-    description: Annotated[Optional[str], Field(description="Optional rule description.")] = None,
-    enabled: Annotated[
-        Optional[bool], Field(description="True to enable rule, False to disable.")
-    ] = True,
-    rank: Annotated[
-        Optional[int],
-        Field(description=RANK_FIELD_DESCRIPTION),
-    ] = None,
+    description: _Description = None,
+    enabled: _Enabled = True,
+    rank: _Rank = None,
     order: Annotated[
         Optional[int],
         Field(
@@ -241,115 +387,35 @@ def zia_create_cloud_firewall_rule(
             )
         ),
     ] = None,
-    src_ips: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Source IPs for the rule. Accepts IP addresses or CIDR. Accepts JSON string or list."
-        ),
-    ] = None,
-    dest_addresses: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Destination IPs for the rule. Accepts IP addresses, CIDR, or hostnames. Accepts JSON string or list."
-        ),
-    ] = None,
-    source_countries: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="Source countries for the rule. Accepts JSON string or list."),
-    ] = None,
-    dest_countries: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="Destination countries for the rule. Accepts JSON string or list."),
-    ] = None,
-    exclude_src_countries: Annotated[
-        Optional[bool], Field(description="Exclude source countries from the rule.")
-    ] = None,
-    dest_ip_categories: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="IP address categories for the rule. Accepts JSON string or list."),
-    ] = None,
-    device_trust_levels: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Device trust levels for the rule application. Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST"
-        ),
-    ] = None,
-    nw_applications: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Network service applications for the rule. Accepts JSON string or list."
-        ),
-    ] = None,
-    enable_full_logging: Annotated[
-        Optional[bool], Field(description="If True, enables full logging.")
-    ] = None,
-    predefined: Annotated[
-        Optional[bool],
-        Field(description="Indicates that the rule is predefined by using a true value."),
-    ] = None,
-    default_rule: Annotated[
-        Optional[bool],
-        Field(description="Indicates whether the rule is the Default Cloud IPS Rule or not."),
-    ] = None,
-    app_services: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for application services for the rule."),
-    ] = None,
-    app_service_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for app service groups.")
-    ] = None,
-    departments: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for departments the rule applies to."),
-    ] = None,
-    dest_ip_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for destination IP groups.")
-    ] = None,
-    dest_ipv6_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for destination IPV6 groups.")
-    ] = None,
-    devices: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for devices managed by Zscaler Client Connector."),
-    ] = None,
-    device_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for device groups managed by Zscaler Client Connector."),
-    ] = None,
-    groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for groups the rule applies to.")
-    ] = None,
-    labels: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for labels the rule applies to.")
-    ] = None,
-    locations: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for locations the rule applies to.")
-    ] = None,
-    location_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for location groups.")
-    ] = None,
-    nw_application_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for network application groups.")
-    ] = None,
-    nw_services: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for network services the rule applies to."),
-    ] = None,
-    nw_service_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for network service groups.")
-    ] = None,
-    time_windows: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for time windows the rule applies to."),
-    ] = None,
-    users: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for users the rule applies to.")
-    ] = None,
-    workload_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for workload groups the rule applies to."),
-    ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    src_ips: _SrcIps = None,
+    dest_addresses: _DestAddresses = None,
+    source_countries: _SourceCountries = None,
+    dest_countries: _DestCountries = None,
+    exclude_src_countries: _ExcludeSrcCountries = None,
+    dest_ip_categories: _DestIpCategories = None,
+    device_trust_levels: _DeviceTrustLevels = None,
+    nw_applications: _NwApplications = None,
+    enable_full_logging: _EnableFullLogging = None,
+    predefined: _Predefined = None,
+    default_rule: _DefaultRule = None,
+    app_services: _AppServices = None,
+    app_service_groups: _AppServiceGroups = None,
+    departments: _Departments = None,
+    dest_ip_groups: _DestIpGroups = None,
+    dest_ipv6_groups: _DestIpv6Groups = None,
+    devices: _Devices = None,
+    device_groups: _DeviceGroups = None,
+    groups: _Groups = None,
+    labels: _Labels = None,
+    locations: _Locations = None,
+    location_groups: _LocationGroups = None,
+    nw_application_groups: _NwApplicationGroups = None,
+    nw_services: _NwServices = None,
+    nw_service_groups: _NwServiceGroups = None,
+    time_windows: _TimeWindows = None,
+    users: _Users = None,
+    workload_groups: _WorkloadGroups = None,
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Creates a new ZIA Cloud Firewall Rule.
@@ -431,7 +497,7 @@ def zia_create_cloud_firewall_rule(
 
     rule, _, err = fw.add_rule(**payload)
     if err:
-        raise Exception(f"Failed to add cloud firewall rule: {err}")
+        raise ZscalerToolError("add cloud firewall rule", err)
     return rule.as_dict()
 
 
@@ -440,7 +506,7 @@ def zia_update_cloud_firewall_rule(
         Union[int, str], Field(description="The ID of the cloud firewall rule to update.")
     ],
     name: Annotated[Optional[str], Field(description="Rule name.")] = None,
-    description: Annotated[Optional[str], Field(description="Optional rule description.")] = None,
+    description: _Description = None,
     rule_action: Annotated[
         Optional[str],
         Field(
@@ -450,13 +516,8 @@ def zia_update_cloud_firewall_rule(
             )
         ),
     ] = None,
-    enabled: Annotated[
-        Optional[bool], Field(description="True to enable rule, False to disable.")
-    ] = None,
-    rank: Annotated[
-        Optional[int],
-        Field(description=RANK_FIELD_DESCRIPTION),
-    ] = None,
+    enabled: _Enabled = None,
+    rank: _Rank = None,
     order: Annotated[
         Optional[int],
         Field(
@@ -466,115 +527,35 @@ def zia_update_cloud_firewall_rule(
             )
         ),
     ] = None,
-    src_ips: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Source IPs for the rule. Accepts IP addresses or CIDR. Accepts JSON string or list."
-        ),
-    ] = None,
-    dest_addresses: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Destination IPs for the rule. Accepts IP addresses, CIDR, or hostnames. Accepts JSON string or list."
-        ),
-    ] = None,
-    source_countries: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="Source countries for the rule. Accepts JSON string or list."),
-    ] = None,
-    dest_countries: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="Destination countries for the rule. Accepts JSON string or list."),
-    ] = None,
-    exclude_src_countries: Annotated[
-        Optional[bool], Field(description="Exclude source countries from the rule.")
-    ] = None,
-    dest_ip_categories: Annotated[
-        Optional[Union[List[str], str]],
-        Field(description="IP address categories for the rule. Accepts JSON string or list."),
-    ] = None,
-    device_trust_levels: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Device trust levels for the rule application. Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST"
-        ),
-    ] = None,
-    nw_applications: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description="Network service applications for the rule. Accepts JSON string or list."
-        ),
-    ] = None,
-    enable_full_logging: Annotated[
-        Optional[bool], Field(description="If True, enables full logging.")
-    ] = None,
-    predefined: Annotated[
-        Optional[bool],
-        Field(description="Indicates that the rule is predefined by using a true value."),
-    ] = None,
-    default_rule: Annotated[
-        Optional[bool],
-        Field(description="Indicates whether the rule is the Default Cloud IPS Rule or not."),
-    ] = None,
-    app_services: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for application services for the rule."),
-    ] = None,
-    app_service_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for app service groups.")
-    ] = None,
-    departments: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for departments the rule applies to."),
-    ] = None,
-    dest_ip_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for destination IP groups.")
-    ] = None,
-    dest_ipv6_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for destination IPV6 groups.")
-    ] = None,
-    devices: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for devices managed by Zscaler Client Connector."),
-    ] = None,
-    device_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for device groups managed by Zscaler Client Connector."),
-    ] = None,
-    groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for groups the rule applies to.")
-    ] = None,
-    labels: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for labels the rule applies to.")
-    ] = None,
-    locations: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for locations the rule applies to.")
-    ] = None,
-    location_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for location groups.")
-    ] = None,
-    nw_application_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for network application groups.")
-    ] = None,
-    nw_services: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for network services the rule applies to."),
-    ] = None,
-    nw_service_groups: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for network service groups.")
-    ] = None,
-    time_windows: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for time windows the rule applies to."),
-    ] = None,
-    users: Annotated[
-        Optional[Union[List[int], str]], Field(description="IDs for users the rule applies to.")
-    ] = None,
-    workload_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for workload groups the rule applies to."),
-    ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    src_ips: _SrcIps = None,
+    dest_addresses: _DestAddresses = None,
+    source_countries: _SourceCountries = None,
+    dest_countries: _DestCountries = None,
+    exclude_src_countries: _ExcludeSrcCountries = None,
+    dest_ip_categories: _DestIpCategories = None,
+    device_trust_levels: _DeviceTrustLevels = None,
+    nw_applications: _NwApplications = None,
+    enable_full_logging: _EnableFullLogging = None,
+    predefined: _Predefined = None,
+    default_rule: _DefaultRule = None,
+    app_services: _AppServices = None,
+    app_service_groups: _AppServiceGroups = None,
+    departments: _Departments = None,
+    dest_ip_groups: _DestIpGroups = None,
+    dest_ipv6_groups: _DestIpv6Groups = None,
+    devices: _Devices = None,
+    device_groups: _DeviceGroups = None,
+    groups: _Groups = None,
+    labels: _Labels = None,
+    locations: _Locations = None,
+    location_groups: _LocationGroups = None,
+    nw_application_groups: _NwApplicationGroups = None,
+    nw_services: _NwServices = None,
+    nw_service_groups: _NwServiceGroups = None,
+    time_windows: _TimeWindows = None,
+    users: _Users = None,
+    workload_groups: _WorkloadGroups = None,
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Updates an existing ZIA Cloud Firewall Rule.
@@ -642,15 +623,16 @@ def zia_update_cloud_firewall_rule(
 
     rule, _, err = fw.update_rule(rule_id, **payload)
     if err:
-        raise Exception(f"Failed to update rule {rule_id}: {err}")
+        raise ZscalerToolError(f"update rule {rule_id}", err)
     return rule.as_dict()
 
 
+@requires_confirmation("rule_id")
 def zia_delete_cloud_firewall_rule(
     rule_id: Annotated[
         Union[int, str], Field(description="The ID of the cloud firewall rule to delete.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """
@@ -670,21 +652,10 @@ def zia_delete_cloud_firewall_rule(
         Delete a rule:
         >>> result = zia_delete_cloud_firewall_rule(rule_id="12345")
     """
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation(
-        "zia_delete_cloud_firewall_rule", confirmed, {"rule_id": str(rule_id)}
-    )
-    if confirmation_check:
-        return confirmation_check
-
     client = get_zscaler_client(service=service)
     fw = client.zia.cloud_firewall_rules
 
     _, _, err = fw.delete_rule(rule_id)
     if err:
-        raise Exception(f"Failed to delete rule {rule_id}: {err}")
+        raise ZscalerToolError(f"delete rule {rule_id}", err)
     return f"Cloud firewall rule {rule_id} deleted successfully."
@@ -47,6 +47,7 @@ from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam, validate_page_size
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -74,7 +75,7 @@ def zia_list_device_groups(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """
     List ZIA device groups with optional filtering.
@@ -183,7 +184,7 @@ def zia_list_devices(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """
     List ZIA devices with comprehensive filtering and pagination options.
@@ -278,9 +279,7 @@ def zia_list_devices(
         query_params["page"] = page
 
     if page_size is not None:
-        if page_size < 1 or page_size > 1000:
-            raise ValueError("page_size must be between 1 and 1000")
-        query_params["pageSize"] = page_size
+        query_params["pageSize"] = validate_page_size(page_size)
 
     devices, _, err = zia.list_devices(query_params=query_params if query_params else None)
     if err:
@@ -294,7 +293,7 @@ def zia_list_devices_lite(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """
     List ZIA devices in lightweight format (ID, name, owner only).
@@ -3,6 +3,8 @@ from typing import Annotated, List, Literal, Optional, Union
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import ZscalerToolError
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 
 def zia_geo_search_tool(
@@ -20,7 +22,7 @@ def zia_geo_search_tool(
     prefix: Annotated[
         Optional[str], Field(description="Required if action is city_prefix_search")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Union[dict, List[dict], str]:
     """
     Performs geographical lookup actions using the ZIA Locations API.
@@ -61,7 +63,7 @@ def zia_geo_search_tool(
             raise ValueError("Both latitude and longitude must be provided.")
         result, _, err = client.zia.locations.list_region_geo_coordinates(latitude, longitude)
         if err:
-            raise Exception(f"Geo lookup by coordinates failed: {err}")
+            raise ZscalerToolError("look up geo data by coordinates", err)
         return result.as_dict()
 
     elif action == "geo_by_ip":
@@ -69,7 +71,7 @@ def zia_geo_search_tool(
             raise ValueError("An IP address must be provided.")
         result, _, err = client.zia.locations.get_geo_by_ip(ip)
         if err:
-            raise Exception(f"Geo lookup by IP failed: {err}")
+            raise ZscalerToolError("look up geo data by IP", err)
         return result.as_dict()
 
     elif action == "city_prefix_search":
@@ -77,7 +79,7 @@ def zia_geo_search_tool(
             raise ValueError("A city prefix must be provided.")
         results, _, err = client.zia.locations.list_cities_by_name(query_params={"prefix": prefix})
         if err:
-            raise Exception(f"City prefix search failed: {err}")
+            raise ZscalerToolError("search cities by prefix", err)
         return [r.as_dict() for r in results or []]
 
     else:
@@ -3,6 +3,8 @@ from typing import Annotated, List, Union
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import ZscalerToolError
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 
 def _get_sandbox_client(service: str):
@@ -11,35 +13,35 @@ def _get_sandbox_client(service: str):
 
 
 def zia_get_sandbox_quota(
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> dict:
     """Return ZIA sandbox quota usage."""
     sandbox_api = _get_sandbox_client(service)
     result, _, err = sandbox_api.get_quota()
     if err:
-        raise Exception(f"Failed to retrieve sandbox quota: {err}")
+        raise ZscalerToolError("retrieve sandbox quota", err)
     return result
 
 
 def zia_get_sandbox_behavioral_analysis(
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Union[List, dict]:
     """Return the list of MD5 hashes blocked by sandbox."""
     sandbox_api = _get_sandbox_client(service)
     result, _, err = sandbox_api.get_behavioral_analysis()
     if err:
-        raise Exception(f"Failed to retrieve sandbox behavioral analysis: {err}")
+        raise ZscalerToolError("retrieve sandbox behavioral analysis", err)
     return result
 
 
 def zia_get_sandbox_file_hash_count(
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> dict:
     """Return sandbox blocked-hash usage statistics."""
     sandbox_api = _get_sandbox_client(service)
     result, _, err = sandbox_api.get_file_hash_count()
     if err:
-        raise Exception(f"Failed to retrieve sandbox file hash count: {err}")
+        raise ZscalerToolError("retrieve sandbox file hash count", err)
     return result
 
 
@@ -48,13 +50,13 @@ def zia_get_sandbox_report(
     report_details: Annotated[
         str, Field(description="Report detail level: 'summary' (default) or 'full'.")
     ] = "summary",
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> dict:
     """Return sandbox analysis report for the provided MD5 hash."""
     sandbox_api = _get_sandbox_client(service)
     result, _, err = sandbox_api.get_report(md5_hash, report_details=report_details)
     if err:
-        raise Exception(f"Failed to retrieve sandbox report for hash {md5_hash}: {err}")
+        raise ZscalerToolError(f"retrieve sandbox report for hash {md5_hash}", err)
     return result
 
 
@@ -65,7 +67,7 @@ def sandbox_manager(
             description="Action to perform: 'quota', 'behavioral_analysis', or 'file_hash_count'."
         ),
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Union[dict, List, str]:
     """
     Backwards-compatible sandbox tool that dispatches to the specialized helpers.
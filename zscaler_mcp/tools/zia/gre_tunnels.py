@@ -3,7 +3,10 @@ from typing import Annotated, Dict, List, Optional
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import ZscalerToolError, check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -15,7 +18,7 @@ def zia_list_gre_tunnels(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """List all ZIA GRE tunnels.
 
@@ -24,16 +27,14 @@ def zia_list_gre_tunnels(
     client = get_zscaler_client(service=service)
     gre_api = client.zia.gre_tunnel
 
-    tunnels, _, err = gre_api.list_gre_tunnels()
-    if err:
-        raise Exception(f"Failed to list GRE tunnels: {err}")
+    tunnels = check_result(gre_api.list_gre_tunnels(), "list GRE tunnels")
     results = [t.as_dict() for t in tunnels]
     return apply_jmespath(results, query)
 
 
 def zia_get_gre_tunnel(
     tunnel_id: Annotated[int, Field(description="Tunnel ID.")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Get a specific ZIA GRE tunnel by ID."""
     if not tunnel_id:
@@ -42,9 +43,7 @@ def zia_get_gre_tunnel(
     client = get_zscaler_client(service=service)
     gre_api = client.zia.gre_tunnel
 
-    tunnel, _, err = gre_api.get_gre_tunnel(tunnel_id)
-    if err:
-        raise Exception(f"Failed to retrieve GRE tunnel {tunnel_id}: {err}")
+    tunnel = check_result(gre_api.get_gre_tunnel(tunnel_id), f"retrieve GRE tunnel {tunnel_id}")
     return tunnel.as_dict()
 
 
@@ -69,7 +68,7 @@ def zia_create_gre_tunnel(
     comment: Annotated[
         Optional[str], Field(description="Comment for the GRE tunnel or static IP.")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """
     Create a new ZIA GRE tunnel.
@@ -85,46 +84,53 @@ def zia_create_gre_tunnel(
     ip_api = client.zia.traffic_static_ip
 
     # Check or create static IP first
-    existing_ips, _, err = ip_api.list_static_ips(query_params={"ip_address": static_ip_address})
-    if err:
-        raise Exception(f"Failed to search static IP: {err}")
+    existing_ips = check_result(
+        ip_api.list_static_ips(query_params={"ip_address": static_ip_address}),
+        "search static IP",
+    )
 
     if existing_ips:
         static_ip = existing_ips[0]
     else:
-        static_ip, _, err = ip_api.add_static_ip(ip_address=static_ip_address, comment=comment)
-        if err:
-            raise Exception(f"Failed to create static IP: {err}")
-
-    payload = {
-        "source_ip": static_ip.ip_address,
-        "ip_unnumbered": ip_unnumbered,
-        "internal_ip_range": internal_ip_range,
-        "comment": comment,
-    }
+        static_ip = check_result(
+            ip_api.add_static_ip(ip_address=static_ip_address, comment=comment),
+            "create static IP",
+        )
 
     if not ip_unnumbered:
-        gre_ranges, _, err = gre_api.list_gre_ranges(
-            query_params={"static_ip": static_ip.ip_address}
+        gre_ranges = check_result(
+            gre_api.list_gre_ranges(query_params={"static_ip": static_ip.ip_address}),
+            "fetch GRE ranges",
         )
-        if err:
-            raise Exception(f"Failed to fetch GRE ranges: {err}")
         if not gre_ranges or "startIPAddress" not in gre_ranges[0]:
-            raise Exception("No valid GRE internal IP ranges found in the response.")
-        payload["internal_ip_range"] = gre_ranges[0]["startIPAddress"]
+            raise ZscalerToolError(
+                "fetch GRE ranges", "no valid GRE internal IP ranges found in the response"
+            )
+        internal_ip_range = gre_ranges[0]["startIPAddress"]
 
-    tunnel, _, err = gre_api.add_gre_tunnel(**payload)
-    if err:
-        raise Exception(f"Failed to create GRE tunnel: {err}")
+    # Omit unset fields so the API applies its own defaults instead of nulls.
+    payload = {
+        key: value
+        for key, value in (
+            ("source_ip", static_ip.ip_address),
+            ("ip_unnumbered", ip_unnumbered),
+            ("internal_ip_range", internal_ip_range),
+            ("comment", comment),
+        )
+        if value is not None
+    }
+
+    tunnel = check_result(gre_api.add_gre_tunnel(**payload), "create GRE tunnel")
     return tunnel.as_dict()
 
 
+@requires_confirmation("tunnel_id")
 def zia_delete_gre_tunnel(
     tunnel_id: Annotated[int, Field(description="Tunnel ID (required).")],
     static_ip_id: Annotated[
         int, Field(description="Static IP ID to delete after tunnel removal (required).")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """
@@ -132,15 +138,6 @@ def zia_delete_gre_tunnel(
 
     Note: GRE tunnel must be deleted before the static IP.
     """
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation("zia_delete_gre_tunnel", confirmed, {"tunnel_id": str(tunnel_id)})
-    if confirmation_check:
-        return confirmation_check
-
     if not tunnel_id or not static_ip_id:
         raise ValueError("Both tunnel_id and static_ip_id are required for delete")
 
@@ -148,12 +145,8 @@ def zia_delete_gre_tunnel(
     gre_api = client.zia.gre_tunnel
     ip_api = client.zia.traffic_static_ip
 
-    _, _, err = gre_api.delete_gre_tunnel(tunnel_id)
-    if err:
-        raise Exception(f"Failed to delete GRE tunnel {tunnel_id}: {err}")
+    check_result(gre_api.delete_gre_tunnel(tunnel_id), f"delete GRE tunnel {tunnel_id}")
 
-    _, _, err = ip_api.delete_static_ip(static_ip_id)
-    if err:
-        raise Exception(f"Failed to delete static IP {static_ip_id}: {err}")
+    check_result(ip_api.delete_static_ip(static_ip_id), f"delete static IP {static_ip_id}")
 
     return f"Deleted GRE tunnel {tunnel_id} and static IP {static_ip_id}"
@@ -3,8 +3,11 @@ from typing import Annotated, Dict, List, Optional, Union
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
-from zscaler_mcp.utils.utils import parse_list
+from zscaler_mcp.common.zia_helpers import ServiceParam, validate_ip_addresses
+from zscaler_mcp.utils.utils import dedupe_list, parse_list
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -20,7 +23,7 @@ def zia_list_ip_destination_groups(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """List ZIA IP destination groups with optional filtering.
 
@@ -30,9 +33,10 @@ def zia_list_ip_destination_groups(
     zia = client.zia.cloud_firewall
 
     query_params = {"exclude_type": exclude_type} if exclude_type else {}
-    groups, _, err = zia.list_ip_destination_groups(query_params=query_params)
-    if err:
-        raise Exception(f"Failed to list IP destination groups: {err}")
+    groups = check_result(
+        zia.list_ip_destination_groups(query_params=query_params),
+        "list IP destination groups",
+    )
     results = [g.as_dict() for g in groups]
     return apply_jmespath(results, query)
 
@@ -41,7 +45,7 @@ def zia_get_ip_destination_group(
     group_id: Annotated[
         Union[int, str], Field(description="Group ID for the IP destination group.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Get a specific ZIA IP destination group by ID."""
     if not group_id:
@@ -50,9 +54,10 @@ def zia_get_ip_destination_group(
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.get_ip_destination_group(group_id)
-    if err:
-        raise Exception(f"Failed to retrieve IP destination group {group_id}: {err}")
+    group = check_result(
+        zia.get_ip_destination_group(group_id),
+        f"retrieve IP destination group {group_id}",
+    )
     return group.as_dict()
 
 
@@ -80,30 +85,33 @@ def zia_create_ip_destination_group(
         Optional[Union[List[str], str]],
         Field(description="List of URL categories. Optional for DSTN_OTHER."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Create a new ZIA IP destination group."""
     if not name or not type:
         raise ValueError("name and type are required")
 
     # Normalize list fields
-    addresses = parse_list(addresses)
-    countries = parse_list(countries)
-    ip_categories = parse_list(ip_categories)
+    addresses = dedupe_list(parse_list(addresses))
+    countries = dedupe_list(parse_list(countries))
+    ip_categories = dedupe_list(parse_list(ip_categories))
+    if type == "DSTN_IP" and addresses:
+        addresses = validate_ip_addresses(addresses, "addresses")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.add_ip_destination_group(
-        name=name,
-        description=description,
-        type=type,
-        addresses=addresses,
-        countries=countries,
-        ip_categories=ip_categories,
+    group = check_result(
+        zia.add_ip_destination_group(
+            name=name,
+            description=description,
+            type=type,
+            addresses=addresses,
+            countries=countries,
+            ip_categories=ip_categories,
+        ),
+        "add IP destination group",
     )
-    if err:
-        raise Exception(f"Failed to add IP destination group: {err}")
     return group.as_dict()
 
 
@@ -124,56 +132,52 @@ def zia_update_ip_destination_group(
     ip_categories: Annotated[
         Optional[Union[List[str], str]], Field(description="List of URL categories.")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Update an existing ZIA IP destination group."""
     if not group_id or not name or not type:
         raise ValueError("group_id, name, and type are required for update")
 
     # Normalize list fields
-    addresses = parse_list(addresses)
-    countries = parse_list(countries)
-    ip_categories = parse_list(ip_categories)
+    addresses = dedupe_list(parse_list(addresses))
+    countries = dedupe_list(parse_list(countries))
+    ip_categories = dedupe_list(parse_list(ip_categories))
+    if type == "DSTN_IP" and addresses:
+        addresses = validate_ip_addresses(addresses, "addresses")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.update_ip_destination_group(
-        group_id=group_id,
-        name=name,
-        description=description,
-        type=type,
-        addresses=addresses,
-        countries=countries,
-        ip_categories=ip_categories,
+    group = check_result(
+        zia.update_ip_destination_group(
+            group_id=group_id,
+            name=name,
+            description=description,
+            type=type,
+            addresses=addresses,
+            countries=countries,
+            ip_categories=ip_categories,
+        ),
+        f"update IP destination group {group_id}",
     )
-    if err:
-        raise Exception(f"Failed to update IP destination group {group_id}: {err}")
     return group.as_dict()
 
 
+@requires_confirmation("group_id")
 def zia_delete_ip_destination_group(
     group_id: Annotated[Union[int, str], Field(description="Group ID (required).")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """Delete a ZIA IP destination group."""
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation("zia_delete_ip_destination_group", confirmed, {"group_id": str(group_id)})
-    if confirmation_check:
-        return confirmation_check
-
     if not group_id:
         raise ValueError("group_id is required for delete")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    _, _, err = zia.delete_ip_destination_group(group_id)
-    if err:
-        raise Exception(f"Failed to delete IP destination group {group_id}: {err}")
+    check_result(
+        zia.delete_ip_destination_group(group_id),
+        f"delete IP destination group {group_id}",
+    )
     return f"Group {group_id} deleted successfully"
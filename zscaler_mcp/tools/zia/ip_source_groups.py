@@ -1,10 +1,13 @@
-import json
 from typing import Annotated, Dict, List, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam, validate_ip_addresses
+from zscaler_mcp.utils.utils import dedupe_list, parse_list
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -15,30 +18,39 @@ def zia_list_ip_source_groups(
     search: Annotated[
         Optional[str], Field(description="Optional search string for filtering list results.")
     ] = None,
+    lite: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, call the lightweight endpoint that returns only each group's "
+                "ID and name. Use it when you just need to resolve a name to an ID."
+            )
+        ),
+    ] = False,
     query: Annotated[
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """List ZIA IP source groups with optional filtering.
 
+    Set ``lite=True`` to fetch only ID and name per group.
     Supports JMESPath client-side filtering via the query parameter.
     """
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
     query_params = {"search": search} if search else {}
-    groups, _, err = zia.list_ip_source_groups(query_params=query_params)
-    if err:
-        raise Exception(f"Error listing IP source groups: {err}")
+    list_groups = zia.list_ip_source_groups_lite if lite else zia.list_ip_source_groups
+    groups = check_result(list_groups(query_params=query_params), "list IP source groups")
     results = [g.as_dict() for g in groups]
     return apply_jmespath(results, query)
 
 
 def zia_get_ip_source_group(
     group_id: Annotated[Union[int, str], Field(description="Group ID for the IP source group.")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Get a specific ZIA IP source group by ID."""
     if not group_id:
@@ -47,9 +59,7 @@ def zia_get_ip_source_group(
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.get_ip_source_group(group_id)
-    if err:
-        raise Exception(f"Error retrieving IP source group {group_id}: {err}")
+    group = check_result(zia.get_ip_source_group(group_id), f"retrieve IP source group {group_id}")
     return group.as_dict()
 
 
@@ -67,27 +77,21 @@ def zia_create_ip_source_group(
     description: Annotated[
         Optional[str], Field(description="Group description (optional).")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Create a new ZIA IP source group."""
     if not name or not ip_addresses:
         raise ValueError("Both name and ip_addresses are required")
 
-    # Normalize IPs
-    if isinstance(ip_addresses, str):
-        try:
-            ip_addresses = json.loads(ip_addresses)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON for ip_addresses: {e}")
+    ip_addresses = validate_ip_addresses(dedupe_list(parse_list(ip_addresses)))
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.add_ip_source_group(
-        name=name, description=description, ip_addresses=ip_addresses
+    group = check_result(
+        zia.add_ip_source_group(name=name, description=description, ip_addresses=ip_addresses),
+        "add IP source group",
     )
-    if err:
-        raise Exception(f"Error adding IP source group: {err}")
     return group.as_dict()
 
 
@@ -101,52 +105,38 @@ def zia_update_ip_source_group(
     description: Annotated[
         Optional[str], Field(description="Group description (optional).")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Update an existing ZIA IP source group."""
     if not group_id or not name or not ip_addresses:
         raise ValueError("group_id, name, and ip_addresses are required for update")
 
-    # Normalize IPs
-    if isinstance(ip_addresses, str):
-        try:
-            ip_addresses = json.loads(ip_addresses)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON for ip_addresses: {e}")
+    ip_addresses = validate_ip_addresses(dedupe_list(parse_list(ip_addresses)))
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.update_ip_source_group(
-        group_id=group_id, name=name, description=description, ip_addresses=ip_addresses
+    group = check_result(
+        zia.update_ip_source_group(
+            group_id=group_id, name=name, description=description, ip_addresses=ip_addresses
+        ),
+        f"update IP source group {group_id}",
     )
-    if err:
-        raise Exception(f"Error updating IP source group: {err}")
     return group.as_dict()
 
 
+@requires_confirmation("group_id")
 def zia_delete_ip_source_group(
     group_id: Annotated[Union[int, str], Field(description="Group ID (required).")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """Delete a ZIA IP source group."""
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation("zia_delete_ip_source_group", confirmed, {"group_id": str(group_id)})
-    if confirmation_check:
-        return confirmation_check
-
     if not group_id:
         raise ValueError("group_id is required for delete")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    _, _, err = zia.delete_ip_source_group(group_id)
-    if err:
-        raise Exception(f"Error deleting IP source group {group_id}: {err}")
+    check_result(zia.delete_ip_source_group(group_id), f"delete IP source group {group_id}")
     return f"Group {group_id} deleted successfully"
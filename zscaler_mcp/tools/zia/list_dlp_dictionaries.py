@@ -1,12 +1,20 @@
-import warnings
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import check_result
+from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.ttl_cache import TTLCache
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
-# Suppress SyntaxWarnings from the zscaler SDK
-warnings.filterwarnings("ignore", category=SyntaxWarning, module="zscaler.zia.dlp_dictionary")
+# Dictionaries change rarely but agents list them repeatedly while building
+# DLP engines and rules, so read results are cached in-process for a short
+# TTL. Callers pass ``bypass_cache=True`` after editing a dictionary.
+_CACHE_TTL_SECONDS = 300
+
+# (client, action, dict_id, search) -> result
+_dict_cache = TTLCache(ttl=_CACHE_TTL_SECONDS)
 
 
 def zia_dlp_dictionary_manager(
@@ -26,8 +34,21 @@ def zia_dlp_dictionary_manager(
             description="Optional search filter for listing dictionaries by name or description."
         ),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
-) -> Union[dict, List[dict]]:
+    bypass_cache: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, skip the 5-minute in-process cache and fetch fresh data "
+                "from the API (e.g. right after a dictionary was edited)."
+            )
+        ),
+    ] = False,
+    query: Annotated[
+        Optional[str],
+        Field(description="JMESPath expression for client-side filtering/projection of results."),
+    ] = None,
+    service: ServiceParam = "zia",
+) -> Any:
     """
     Manages ZIA DLP Dictionaries for data loss prevention pattern and phrase matching.
 
@@ -39,6 +60,8 @@ def zia_dlp_dictionary_manager(
         action (str): Operation to perform: read (list all or retrieve specific by dict_id), read_lite (list with minimal data).
         dict_id (int/str, optional): Optional dictionary ID to retrieve a specific dictionary.
         search (str, optional): Search string to match against dictionary name or description.
+        bypass_cache (bool, optional): Skip the in-process cache and fetch fresh data.
+        query (str, optional): JMESPath expression applied to list results.
         service (str, optional): The service to use (default: "zia").
 
     Returns:
@@ -70,32 +93,43 @@ def zia_dlp_dictionary_manager(
         - Predefined dictionaries are provided by Zscaler and cannot be modified.
         - Custom dictionaries can be created with specific patterns and phrases.
         - Dictionaries are used by DLP engines to create detection rules.
+        - Results are cached in-process for 5 minutes per (action, dict_id, search).
     """
+    if action not in ("read", "read_lite"):
+        raise ValueError(f"Unsupported action: {action}")
+
     client = get_zscaler_client(service=service)
+    key = (client, action, str(dict_id) if dict_id else None, search or None)
+    result = _dict_cache.get_or_fetch(
+        key, lambda: _fetch_dictionaries(client, action, dict_id, search), bypass=bypass_cache
+    )
+    return apply_jmespath(result, query) if isinstance(result, list) else result
+
 
+def _fetch_dictionaries(
+    client: Any, action: str, dict_id: Optional[Union[int, str]], search: Optional[str]
+) -> Union[dict, List[dict]]:
+    """Fetch DLP dictionary data from the API (uncached)."""
     dlp_dict = client.zia.dlp_dictionary
 
     if action == "read":
         if dict_id:
             # Retrieve a specific dictionary by ID
-            dictionary, _, err = dlp_dict.get_dict(dict_id)
-            if err:
-                raise Exception(f"Failed to retrieve dictionary {dict_id}: {err}")
+            dictionary = check_result(dlp_dict.get_dict(dict_id), f"retrieve dictionary {dict_id}")
             return dictionary.as_dict()
         else:
             # List all dictionaries
             query = {"search": search} if search else {}
-            dictionaries, _, err = dlp_dict.list_dicts(query_params=query)
-            if err:
-                raise Exception(f"Failed to list DLP dictionaries: {err}")
+            dictionaries = check_result(
+                dlp_dict.list_dicts(query_params=query),
+                "list DLP dictionaries",
+            )
             return [d.as_dict() for d in dictionaries]
 
-    elif action == "read_lite":
+    else:
         query = {"search": search} if search else {}
-        dictionaries, _, err = dlp_dict.list_dicts_lite(query_params=query)
-        if err:
-            raise Exception(f"Failed to list DLP dictionaries (lite): {err}")
+        dictionaries = check_result(
+            dlp_dict.list_dicts_lite(query_params=query),
+            "list DLP dictionaries (lite)",
+        )
         return [d.as_dict() for d in dictionaries]
-
-    else:
-        raise ValueError(f"Unsupported action: {action}")
@@ -1,8 +1,20 @@
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import check_result
+from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.ttl_cache import TTLCache
+from zscaler_mcp.common.zia_helpers import ServiceParam
+
+# Engines are referenced by ID from DLP rules and re-listed often while
+# building them, but rarely change, so read results are cached in-process
+# for a short TTL. Callers pass ``bypass_cache=True`` after editing an engine.
+_CACHE_TTL_SECONDS = 300
+
+# (client, action, engine_id, search) -> result
+_engine_cache = TTLCache(ttl=_CACHE_TTL_SECONDS)
 
 
 def zia_dlp_engine_manager(
@@ -20,8 +32,21 @@ def zia_dlp_engine_manager(
         Optional[str],
         Field(description="Optional search filter for listing engines by name or description."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
-) -> Union[dict, List[dict]]:
+    bypass_cache: Annotated[
+        bool,
+        Field(
+            description=(
+                "If True, skip the 5-minute in-process cache and fetch fresh data "
+                "from the API (e.g. right after an engine was edited)."
+            )
+        ),
+    ] = False,
+    query: Annotated[
+        Optional[str],
+        Field(description="JMESPath expression for client-side filtering/projection of results."),
+    ] = None,
+    service: ServiceParam = "zia",
+) -> Any:
     """
     Manages ZIA DLP Engines for data loss prevention rule evaluation.
 
@@ -33,6 +58,8 @@ def zia_dlp_engine_manager(
         action (str): Operation to perform: read (list all or retrieve specific by engine_id), read_lite (list with minimal data).
         engine_id (int/str, optional): Optional engine ID to retrieve a specific engine.
         search (str, optional): Search string to match against engine name or description.
+        bypass_cache (bool, optional): Skip the in-process cache and fetch fresh data.
+        query (str, optional): JMESPath expression applied to list results.
         service (str, optional): The service to use (default: "zia").
 
     Returns:
@@ -66,32 +93,46 @@ def zia_dlp_engine_manager(
         - Custom engines allow for organization-specific data loss prevention rules.
         - Engine expressions reference DLP dictionaries by their IDs (e.g., D63.S > 1).
         - Engines are used in DLP rules to define what content should be monitored or blocked.
+        - Results are cached in-process for 5 minutes per (action, engine_id, search).
     """
+    if action not in ("read", "read_lite"):
+        raise ValueError(f"Unsupported action: {action}")
+
     client = get_zscaler_client(service=service)
+    key = (client, action, str(engine_id) if engine_id else None, search or None)
+    result = _engine_cache.get_or_fetch(
+        key, lambda: _fetch_engines(client, action, engine_id, search), bypass=bypass_cache
+    )
+    return apply_jmespath(result, query) if isinstance(result, list) else result
+
 
+def _fetch_engines(
+    client: Any, action: str, engine_id: Optional[Union[int, str]], search: Optional[str]
+) -> Union[dict, List[dict]]:
+    """Fetch DLP engine data from the API (uncached)."""
     dlp_engine = client.zia.dlp_engine
 
     if action == "read":
         if engine_id:
             # Retrieve a specific engine by ID
-            engine, _, err = dlp_engine.get_dlp_engines(engine_id)
-            if err:
-                raise Exception(f"Failed to retrieve engine {engine_id}: {err}")
+            engine = check_result(
+                dlp_engine.get_dlp_engines(engine_id),
+                f"retrieve engine {engine_id}",
+            )
             return engine.as_dict()
         else:
             # List all engines
             query = {"search": search} if search else {}
-            engines, _, err = dlp_engine.list_dlp_engines(query_params=query)
-            if err:
-                raise Exception(f"Failed to list DLP engines: {err}")
+            engines = check_result(
+                dlp_engine.list_dlp_engines(query_params=query),
+                "list DLP engines",
+            )
             return [e.as_dict() for e in engines]
 
-    elif action == "read_lite":
+    else:
         query = {"search": search} if search else {}
-        engines, _, err = dlp_engine.list_dlp_engines_lite(query_params=query)
-        if err:
-            raise Exception(f"Failed to list DLP engines (lite): {err}")
+        engines = check_result(
+            dlp_engine.list_dlp_engines_lite(query_params=query),
+            "list DLP engines (lite)",
+        )
         return [e.as_dict() for e in engines]
-
-    else:
-        raise ValueError(f"Unsupported action: {action}")
@@ -1,8 +1,11 @@
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import check_result
+from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import validate_page_size
 
 
 def zia_user_department_manager(
@@ -43,10 +46,14 @@ def zia_user_department_manager(
         Optional[Literal["asc", "desc", "rule_execution"]],
         Field(description="Sort order for listing departments."),
     ] = None,
+    query: Annotated[
+        Optional[str],
+        Field(description="JMESPath expression for client-side filtering/projection of results."),
+    ] = None,
     service: Annotated[
         str, Field(description="Zscaler service name. Always 'zia' for this tool.")
     ] = "zia",
-) -> Union[dict, List[dict]]:
+) -> Any:
     """
     ZIA User Departments manager using the Python SDK.
 
@@ -67,6 +74,7 @@ def zia_user_department_manager(
     - page_size: Optional page size for pagination. The SDK's default is 100; maximum is 1000.
     - sort_by: Optional sort field. Supported values: "id", "name", "expiry", "status", "external_id", "rank".
     - sort_order: Optional sort order. Supported values: "asc", "desc", "rule_execution".
+    - query: Optional JMESPath expression applied to the department list.
     - service: Zscaler service. Use "zia".
 
     Returns:
@@ -98,41 +106,40 @@ def zia_user_department_manager(
     if action == "read":
         # If department_id is provided, get a single department
         if department_id is not None:
-            department, _, err = zia.get_department(department_id)
-            if err:
-                raise Exception(f"Error retrieving department {department_id}: {err}")
+            department = check_result(
+                zia.get_department(department_id),
+                f"retrieve department {department_id}",
+            )
             return department.as_dict()
 
         # Otherwise, list departments with optional filters
-        query_params = {}
-        if limit_search is not None:
-            query_params["limit_search"] = limit_search
-        if search is not None:
-            query_params["search"] = search
-        if page is not None:
-            query_params["page"] = page
-        if page_size is not None:
-            if page_size <= 0:
-                raise ValueError("page_size must be a positive integer")
-            if page_size > 1000:
-                raise ValueError("page_size cannot exceed 1000")
-            query_params["page_size"] = page_size
-        if sort_by is not None:
-            query_params["sort_by"] = sort_by
-        if sort_order is not None:
-            query_params["sort_order"] = sort_order
-
-        departments, _, err = zia.list_departments(query_params=query_params or None)
-        if err:
-            raise Exception(f"Error listing departments: {err}")
-        return [d.as_dict() for d in departments]
+        validate_page_size(page_size)
+        query_params = {
+            k: v
+            for k, v in (
+                ("limit_search", limit_search),
+                ("search", search),
+                ("page", page),
+                ("page_size", page_size),
+                ("sort_by", sort_by),
+                ("sort_order", sort_order),
+            )
+            if v is not None
+        }
+
+        departments = check_result(
+            zia.list_departments(query_params=query_params or None),
+            "list departments",
+        )
+        return apply_jmespath([d.as_dict() for d in departments], query)
 
     if action == "read_lite":
         if not department_id:
             raise ValueError("department_id is required for action 'read_lite'")
-        department, _, err = zia.get_department_lite(department_id)
-        if err:
-            raise Exception(f"Error retrieving department (lite) {department_id}: {err}")
+        department = check_result(
+            zia.get_department_lite(department_id),
+            f"retrieve department (lite) {department_id}",
+        )
         return department.as_dict()
 
     raise ValueError(f"Unsupported action: {action}")
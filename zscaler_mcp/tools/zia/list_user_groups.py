@@ -1,14 +1,11 @@
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
-
-# Maximum page_size accepted by the ZIA list_groups endpoint.
-# Used internally when `name` is provided so we can pull a wide page
-# and do client-side normalized matching without making the agent
-# wrestle with pagination.
-_MAX_PAGE_SIZE = 1000
+from zscaler_mcp.common.errors import check_result
+from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import MAX_PAGE_SIZE, validate_page_size
 
 
 def zia_user_group_manager(
@@ -76,10 +73,14 @@ def zia_user_group_manager(
         Optional[Literal["asc", "desc", "rule_execution"]],
         Field(description="Sort order for listing groups. Supported: asc, desc, rule_execution."),
     ] = None,
+    query: Annotated[
+        Optional[str],
+        Field(description="JMESPath expression for client-side filtering/projection of results."),
+    ] = None,
     service: Annotated[
         str, Field(description="Zscaler service name. Always 'zia' for this tool.")
     ] = "zia",
-) -> Union[dict, List[dict]]:
+) -> Any:
     """ZIA User Groups manager (read-only) using the Python SDK.
 
     This tool exposes read operations for ZIA User Groups via the SDK methods
@@ -99,6 +100,8 @@ def zia_user_group_manager(
       rather than group names, so empty results may not mean "no group with
       this name exists".
     - No filters → list all groups (paginated).
+    - ``query`` → JMESPath expression applied to the list after the
+      ``name`` match (e.g. ``"[].{id: id, name: name}"``).
 
     Returns:
         - Single dict when ``group_id`` is provided.
@@ -125,42 +128,33 @@ def zia_user_group_manager(
         raise ValueError(f"Unsupported action: {action}")
 
     if group_id is not None:
-        group, _, err = zia.get_group(group_id)
-        if err:
-            raise Exception(f"Error retrieving user group {group_id}: {err}")
+        group = check_result(zia.get_group(group_id), f"retrieve user group {group_id}")
         return group.as_dict()
 
     if name is not None and not str(name).strip():
         raise ValueError("`name` must be a non-empty string when provided.")
 
-    query_params: dict = {}
-
     # When `name` is supplied we deliberately skip the server-side `search`
     # parameter (its behavior on this endpoint is unreliable) and pull the
     # widest page we can so the client-side substring match is authoritative.
     if name is not None:
-        query_params["page_size"] = _MAX_PAGE_SIZE
+        query_params: dict = {"page_size": MAX_PAGE_SIZE}
     else:
-        if search is not None:
-            query_params["search"] = search
-        if defined_by is not None:
-            query_params["defined_by"] = defined_by
-        if page is not None:
-            query_params["page"] = page
-        if page_size is not None:
-            if page_size <= 0:
-                raise ValueError("page_size must be a positive integer")
-            if page_size > _MAX_PAGE_SIZE:
-                raise ValueError(f"page_size cannot exceed {_MAX_PAGE_SIZE}")
-            query_params["page_size"] = page_size
-        if sort_by is not None:
-            query_params["sort_by"] = sort_by
-        if sort_order is not None:
-            query_params["sort_order"] = sort_order
-
-    groups, _, err = zia.list_groups(query_params=query_params or None)
-    if err:
-        raise Exception(f"Error listing user groups: {err}")
+        validate_page_size(page_size)
+        query_params = {
+            k: v
+            for k, v in (
+                ("search", search),
+                ("defined_by", defined_by),
+                ("page", page),
+                ("page_size", page_size),
+                ("sort_by", sort_by),
+                ("sort_order", sort_order),
+            )
+            if v is not None
+        }
+
+    groups = check_result(zia.list_groups(query_params=query_params or None), "list user groups")
 
     results = [g.as_dict() for g in (groups or [])]
 
@@ -171,4 +165,4 @@ def zia_user_group_manager(
             if needle in str(g.get("name", "")).lower()
         ]
 
-    return results
+    return apply_jmespath(results, query)
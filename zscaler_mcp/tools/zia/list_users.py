@@ -1,8 +1,11 @@
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.errors import check_result
+from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import validate_page_size
 
 
 def zia_users_manager(
@@ -38,11 +41,15 @@ def zia_users_manager(
         Optional[int],
         Field(description="Page size for listing users. Default is 100; maximum is 1000."),
     ] = None,
+    query: Annotated[
+        Optional[str],
+        Field(description="JMESPath expression for client-side filtering/projection of results."),
+    ] = None,
     service: Annotated[
         str,
         Field(description="Zscaler service name. Always 'zia' for this tool."),
     ] = "zia",
-) -> Union[dict, List[dict]]:
+) -> Any:
     """
     ZIA Users manager using the Python SDK.
 
@@ -61,6 +68,7 @@ def zia_users_manager(
     - name: Optional user name filter (starts with match).
     - page: Optional page offset for pagination.
     - page_size: Optional page size for pagination. Default 100; maximum 1000.
+    - query: Optional JMESPath expression applied to the user list.
     - service: Zscaler service. Use "zia".
 
     Returns:
@@ -89,31 +97,24 @@ def zia_users_manager(
     if action == "read":
         # If user_id is provided, get a single user
         if user_id is not None:
-            user, _, err = zia.get_user(user_id)
-            if err:
-                raise Exception(f"Error retrieving user {user_id}: {err}")
+            user = check_result(zia.get_user(user_id), f"retrieve user {user_id}")
             return user.as_dict()
 
         # Otherwise, list users with optional filters
-        query_params = {}
-        if dept is not None:
-            query_params["dept"] = dept
-        if group is not None:
-            query_params["group"] = group
-        if name is not None:
-            query_params["name"] = name
-        if page is not None:
-            query_params["page"] = page
-        if page_size is not None:
-            if page_size <= 0:
-                raise ValueError("page_size must be a positive integer")
-            if page_size > 1000:
-                raise ValueError("page_size cannot exceed 1000")
-            query_params["page_size"] = page_size
-
-        users, _, err = zia.list_users(query_params=query_params or None)
-        if err:
-            raise Exception(f"Error listing users: {err}")
-        return [u.as_dict() for u in users]
+        validate_page_size(page_size)
+        query_params = {
+            k: v
+            for k, v in (
+                ("dept", dept),
+                ("group", group),
+                ("name", name),
+                ("page", page),
+                ("page_size", page_size),
+            )
+            if v is not None
+        }
+
+        users = check_result(zia.list_users(query_params=query_params or None), "list users")
+        return apply_jmespath([u.as_dict() for u in users], query)
 
     raise ValueError(f"Unsupported action: {action}")
@@ -1,10 +1,13 @@
-import json
 from typing import Annotated, Any, Dict, List, Optional, Union
 
+import orjson
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -20,7 +23,7 @@ def zia_list_locations(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict[str, Any]]:
     """List all ZIA locations with optional filtering.
 
@@ -29,16 +32,17 @@ def zia_list_locations(
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    result, _, err = locations_api.list_locations(query_params=query_params or {})
-    if err:
-        raise Exception(f"Failed to list locations: {err}")
+    result = check_result(
+        locations_api.list_locations(query_params=query_params or None),
+        "list locations",
+    )
     results = [loc.as_dict() for loc in result or []]
     return apply_jmespath(results, query)
 
 
 def zia_get_location(
     location_id: Annotated[int, Field(description="Location ID.")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict[str, Any]:
     """Get a specific ZIA location by ID."""
     if not location_id:
@@ -47,9 +51,7 @@ def zia_get_location(
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    result, _, err = locations_api.get_location(location_id)
-    if err:
-        raise Exception(f"Failed to get location {location_id}: {err}")
+    result = check_result(locations_api.get_location(location_id), f"get location {location_id}")
     return result.as_dict()
 
 
@@ -89,7 +91,7 @@ def zia_list_location_groups(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Any:
     """List ZIA location groups, used as the ``location_groups`` operand on rule resources.
 
@@ -119,16 +121,17 @@ def zia_list_location_groups(
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    result, _, err = locations_api.list_location_groups(query_params=query_params or None)
-    if err:
-        raise Exception(f"Failed to list location groups: {err}")
+    result = check_result(
+        locations_api.list_location_groups(query_params=query_params or None),
+        "list location groups",
+    )
     results = [grp.as_dict() for grp in result or []]
     return apply_jmespath(results, query)
 
 
 def zia_get_location_group(
     group_id: Annotated[int, Field(description="Location group ID.")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict[str, Any]:
     """Get a specific ZIA location group by ID."""
     if not group_id:
@@ -137,9 +140,10 @@ def zia_get_location_group(
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    result, _, err = locations_api.get_location_group(group_id)
-    if err:
-        raise Exception(f"Failed to get location group {group_id}: {err}")
+    result = check_result(
+        locations_api.get_location_group(group_id),
+        f"get location group {group_id}",
+    )
     return result.as_dict()
 
 
@@ -147,13 +151,28 @@ def zia_get_location_group(
 # WRITE OPERATIONS
 # =============================================================================
 
+# A new location must be anchored by at least one of these.
+_LOCATION_ONEOF_KEYS = ("ipAddresses", "vpnCredentials")
+
+
+def _parse_location(location: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+    """Decode a JSON-string location payload and check it is an object."""
+    if isinstance(location, str):
+        try:
+            location = orjson.loads(location)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON for location: {e}")
+    if not isinstance(location, dict):
+        raise ValueError("location must be a JSON object")
+    return location
+
 
 def zia_create_location(
     location: Annotated[
         Union[Dict[str, Any], str],
         Field(description="Location configuration as dictionary or JSON string (required)."),
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict[str, Any]:
     """
     Create a new ZIA location.
@@ -177,13 +196,9 @@ def zia_create_location(
     if not location:
         raise ValueError("location dictionary or JSON string is required")
 
-    if isinstance(location, str):
-        try:
-            location = json.loads(location)
-        except Exception as e:
-            raise ValueError(f"Invalid JSON for location: {e}")
+    location = _parse_location(location)
 
-    if not location.get("ipAddresses") and not location.get("vpnCredentials"):
+    if not any(location.get(k) for k in _LOCATION_ONEOF_KEYS):
         raise ValueError(
             "Location creation requires either `ipAddresses` or `vpnCredentials`. "
             "If neither is provided, you may want to create a static IP using the `zia_create_static_ip` tool."
@@ -192,9 +207,7 @@ def zia_create_location(
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    created, _, err = locations_api.add_location(**location)
-    if err:
-        raise Exception(f"Failed to create location: {err}")
+    created = check_result(locations_api.add_location(**location), "create location")
     return created.as_dict()
 
 
@@ -206,30 +219,28 @@ def zia_update_location(
             description="Updated location configuration as dictionary or JSON string (required)."
         ),
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict[str, Any]:
     """Update an existing ZIA location."""
     if not location_id or not location:
         raise ValueError("location_id and location configuration are required")
 
-    if isinstance(location, str):
-        try:
-            location = json.loads(location)
-        except Exception as e:
-            raise ValueError(f"Invalid JSON for location: {e}")
+    location = _parse_location(location)
 
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    updated, _, err = locations_api.update_location(location_id, **location)
-    if err:
-        raise Exception(f"Failed to update location {location_id}: {err}")
+    updated = check_result(
+        locations_api.update_location(location_id, **location),
+        f"update location {location_id}",
+    )
     return updated.as_dict()
 
 
+@requires_confirmation("location_id")
 def zia_delete_location(
     location_id: Annotated[int, Field(description="Location ID (required).")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """
@@ -237,22 +248,11 @@ def zia_delete_location(
 
     Note: Associated resources must be deleted in the reverse order they were created.
     """
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation("zia_delete_location", confirmed, {"location_id": str(location_id)})
-    if confirmation_check:
-        return confirmation_check
-
     if not location_id:
         raise ValueError("location_id is required")
 
     client = get_zscaler_client(service=service)
     locations_api = client.zia.locations
 
-    _, _, err = locations_api.delete_location(location_id)
-    if err:
-        raise Exception(f"Failed to delete location {location_id}: {err}")
+    check_result(locations_api.delete_location(location_id), f"delete location {location_id}")
     return f"Deleted location {location_id}"
@@ -1,10 +1,13 @@
-import json
 from typing import Annotated, Dict, List, Optional, Union
 
+import orjson
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -19,7 +22,7 @@ def zia_list_network_app_groups(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """List ZIA network application groups with optional filtering.
 
@@ -28,10 +31,11 @@ def zia_list_network_app_groups(
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    query_params = {"search": search} if search else {}
-    groups, _, err = zia.list_network_app_groups(query_params=query_params)
-    if err:
-        raise Exception(f"Failed to list network app groups: {err}")
+    query_params = {"search": search} if search else None
+    groups = check_result(
+        zia.list_network_app_groups(query_params=query_params),
+        "list network app groups",
+    )
     results = [g.as_dict() for g in groups]
     return apply_jmespath(results, query)
 
@@ -40,7 +44,7 @@ def zia_get_network_app_group(
     group_id: Annotated[
         Union[int, str], Field(description="Group ID for the network application group.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Get a specific ZIA network application group by ID."""
     if not group_id:
@@ -49,9 +53,10 @@ def zia_get_network_app_group(
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.get_network_app_group(group_id)
-    if err:
-        raise Exception(f"Failed to retrieve network app group {group_id}: {err}")
+    group = check_result(
+        zia.get_network_app_group(group_id),
+        f"retrieve network app group {group_id}",
+    )
     return group.as_dict()
 
 
@@ -68,7 +73,7 @@ def zia_create_network_app_group(
     description: Annotated[
         Optional[str], Field(description="Group description (optional).")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Create a new ZIA network application group."""
     if not name or not network_applications:
@@ -76,18 +81,19 @@ def zia_create_network_app_group(
 
     if isinstance(network_applications, str):
         try:
-            network_applications = json.loads(network_applications)
-        except json.JSONDecodeError as e:
+            network_applications = orjson.loads(network_applications)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON for network_applications: {e}")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.add_network_app_group(
-        name=name, description=description, network_applications=network_applications
+    group = check_result(
+        zia.add_network_app_group(
+            name=name, description=description, network_applications=network_applications
+        ),
+        "add network app group",
     )
-    if err:
-        raise Exception(f"Failed to add network app group: {err}")
     return group.as_dict()
 
 
@@ -100,7 +106,7 @@ def zia_update_network_app_group(
     description: Annotated[
         Optional[str], Field(description="Group description (optional).")
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Update an existing ZIA network application group."""
     if not group_id or not name or not network_applications:
@@ -108,46 +114,37 @@ def zia_update_network_app_group(
 
     if isinstance(network_applications, str):
         try:
-            network_applications = json.loads(network_applications)
-        except json.JSONDecodeError as e:
+            network_applications = orjson.loads(network_applications)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON for network_applications: {e}")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    group, _, err = zia.update_network_app_group(
-        group_id=group_id,
-        name=name,
-        description=description,
-        network_applications=network_applications,
+    group = check_result(
+        zia.update_network_app_group(
+            group_id=group_id,
+            name=name,
+            description=description,
+            network_applications=network_applications,
+        ),
+        f"update network app group {group_id}",
     )
-    if err:
-        raise Exception(f"Failed to update network app group {group_id}: {err}")
     return group.as_dict()
 
 
+@requires_confirmation("group_id")
 def zia_delete_network_app_group(
     group_id: Annotated[Union[int, str], Field(description="Group ID (required).")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """Delete a ZIA network application group."""
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation("zia_delete_network_app_group", confirmed, {"group_id": str(group_id)})
-    if confirmation_check:
-        return confirmation_check
-
     if not group_id:
         raise ValueError("group_id is required for delete")
 
     client = get_zscaler_client(service=service)
     zia = client.zia.cloud_firewall
 
-    _, _, err = zia.delete_network_app_group(group_id)
-    if err:
-        raise Exception(f"Failed to delete network app group {group_id}: {err}")
+    check_result(zia.delete_network_app_group(group_id), f"delete network app group {group_id}")
     return f"Group {group_id} deleted successfully"
@@ -3,7 +3,10 @@ from typing import Annotated, Dict, List, Optional
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
+from zscaler_mcp.common.zia_helpers import ServiceParam
 
 # =============================================================================
 # READ-ONLY OPERATIONS
@@ -18,7 +21,7 @@ def zia_list_rule_labels(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[Dict]:
     """List ZIA rule labels.
 
@@ -27,16 +30,14 @@ def zia_list_rule_labels(
     client = get_zscaler_client(service=service)
     api = client.zia.rule_labels
 
-    labels, _, err = api.list_labels(query_params=query_params or {})
-    if err:
-        raise Exception(f"List failed: {err}")
+    labels = check_result(api.list_labels(query_params=query_params or None), "list rule labels")
     results = [label.as_dict() for label in labels]
     return apply_jmespath(results, query)
 
 
 def zia_get_rule_label(
     label_id: Annotated[int, Field(description="Label ID.")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Get a specific ZIA rule label by ID."""
     if not label_id:
@@ -45,9 +46,7 @@ def zia_get_rule_label(
     client = get_zscaler_client(service=service)
     api = client.zia.rule_labels
 
-    result, _, err = api.get_label(label_id=label_id)
-    if err:
-        raise Exception(f"Read failed: {err}")
+    result = check_result(api.get_label(label_id=label_id), f"retrieve rule label {label_id}")
     return result.as_dict()
 
 
@@ -59,7 +58,7 @@ def zia_get_rule_label(
 def zia_create_rule_label(
     name: Annotated[str, Field(description="Label name (required).")],
     description: Annotated[Optional[str], Field(description="Optional description.")] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Create a new ZIA rule label."""
     if not name:
@@ -72,9 +71,7 @@ def zia_create_rule_label(
     if description:
         payload["description"] = description
 
-    created, _, err = api.add_label(**payload)
-    if err:
-        raise Exception(f"Create failed: {err}")
+    created = check_result(api.add_label(**payload), "create rule label")
     return created.as_dict()
 
 
@@ -82,7 +79,7 @@ def zia_update_rule_label(
     label_id: Annotated[int, Field(description="Label ID (required).")],
     name: Annotated[Optional[str], Field(description="Label name.")] = None,
     description: Annotated[Optional[str], Field(description="Optional description.")] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> Dict:
     """Update an existing ZIA rule label."""
     if not label_id:
@@ -99,15 +96,17 @@ def zia_update_rule_label(
     client = get_zscaler_client(service=service)
     api = client.zia.rule_labels
 
-    updated, _, err = api.update_label(label_id=label_id, **update_fields)
-    if err:
-        raise Exception(f"Update failed: {err}")
+    updated = check_result(
+        api.update_label(label_id=label_id, **update_fields),
+        f"update rule label {label_id}",
+    )
     return updated.as_dict()
 
 
+@requires_confirmation("label_id")
 def zia_delete_rule_label(
     label_id: Annotated[int, Field(description="Label ID (required).")],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """Delete a ZIA rule label.
@@ -115,24 +114,11 @@ def zia_delete_rule_label(
     🚨 DESTRUCTIVE OPERATION - Requires double confirmation.
     This action cannot be undone.
     """
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation(
-        "zia_delete_rule_label", confirmed, {"label_id": label_id}
-    )
-    if confirmation_check:
-        return confirmation_check
-
     if not label_id:
         raise ValueError("label_id is required for deletion")
 
     client = get_zscaler_client(service=service)
     api = client.zia.rule_labels
 
-    _, _, err = api.delete_label(label_id=label_id)
-    if err:
-        raise Exception(f"Delete failed: {err}")
+    check_result(api.delete_label(label_id=label_id), f"delete rule label {label_id}")
     return f"Deleted rule label {label_id}"
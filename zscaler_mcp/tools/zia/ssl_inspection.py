@@ -1,12 +1,15 @@
-import json
 from typing import Annotated, Dict, List, Optional, Union
 
+import orjson
 from pydantic import Field
 
 from zscaler_mcp.client import get_zscaler_client
+from zscaler_mcp.common.elicitation import requires_confirmation
+from zscaler_mcp.common.errors import check_result
 from zscaler_mcp.common.jmespath_utils import apply_jmespath
 from zscaler_mcp.common.zia_helpers import (
     RANK_FIELD_DESCRIPTION,
+    ServiceParam,
     apply_default_order,
     apply_default_rank,
     resolve_cloud_applications,
@@ -15,6 +18,171 @@ from zscaler_mcp.common.zia_helpers import (
 )
 from zscaler_mcp.utils.utils import parse_list
 
+# Optional rule attributes shared by the create and update tools.
+
+_Description = Annotated[Optional[str], Field(description="Optional rule description.")]
+
+_Rank = Annotated[Optional[int], Field(description=RANK_FIELD_DESCRIPTION)]
+
+_RoadWarriorForKerberos = Annotated[
+    Optional[bool],
+    Field(
+        description="If True, the rule is applied to remote users that use PAC with Kerberos authentication."
+    ),
+]
+
+_Predefined = Annotated[
+    Optional[bool],
+    Field(description="Indicates that the rule is predefined by using a true value."),
+]
+
+_DefaultRule = Annotated[
+    Optional[bool],
+    Field(
+        description="Indicates whether the rule is the Default Cloud SSL Inspection Rule or not."
+    ),
+]
+
+_DeviceTrustLevels = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description=(
+            "Device trust levels for which the rule must be applied. "
+            "Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST. "
+            "Accepts JSON string or list."
+        )
+    ),
+]
+
+_UserAgentTypes = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description=(
+            "User Agent types on which this rule will be applied. "
+            "Values: OPERA, FIREFOX, MSIE, MSEDGE, CHROME, SAFARI, OTHER, MSCHREDGE. "
+            "Accepts JSON string or list."
+        )
+    ),
+]
+
+_Platforms = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description=(
+            "Platform types for which the rule must be applied. "
+            "Values: SCAN_IOS, SCAN_ANDROID, SCAN_MACOS, SCAN_WINDOWS, NO_CLIENT_CONNECTOR, SCAN_LINUX. "
+            "Accepts JSON string or list."
+        )
+    ),
+]
+
+_CloudApplications = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description=(
+            "Cloud applications for which the SSL inspection rule is applied. "
+            "Accepts EITHER canonical ZIA enum tokens (e.g. 'ONEDRIVE', "
+            "'SHAREPOINT_ONLINE') OR friendly display names ('OneDrive', "
+            "'share point online'). Friendly names are auto-resolved to the "
+            "canonical enum via the policy-engine SSL catalog before the "
+            "API call — set resolve_cloud_apps=False to disable. Accepts "
+            "JSON string or list."
+        )
+    ),
+]
+
+_UrlCategories = Annotated[
+    Optional[Union[List[str], str]],
+    Field(
+        description=(
+            "URL categories for which the rule must be applied. "
+            "Accepts URL category names. Accepts JSON string or list."
+        )
+    ),
+]
+
+_DestIpGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for destination IP groups. Accepts JSON string or list."),
+]
+
+_SourceIpGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for source IP groups. Accepts JSON string or list."),
+]
+
+_Devices = Annotated[
+    Optional[Union[List[int], str]],
+    Field(
+        description="IDs for devices managed by Zscaler Client Connector. Accepts JSON string or list."
+    ),
+]
+
+_DeviceGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(
+        description="IDs for device groups managed by Zscaler Client Connector. Accepts JSON string or list."
+    ),
+]
+
+_Groups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for user groups the rule applies to. Accepts JSON string or list."),
+]
+
+_Users = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for users the rule applies to. Accepts JSON string or list."),
+]
+
+_Labels = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for labels the rule applies to. Accepts JSON string or list."),
+]
+
+_Locations = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for locations the rule applies to. Accepts JSON string or list."),
+]
+
+_LocationGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(description="IDs for location groups. Accepts JSON string or list."),
+]
+
+_ProxyGateways = Annotated[
+    Optional[Union[List[int], str]],
+    Field(
+        description="IDs for proxy chaining gateways for which this rule is applicable. Accepts JSON string or list."
+    ),
+]
+
+_WorkloadGroups = Annotated[
+    Optional[Union[List[int], str]],
+    Field(
+        description="IDs for workload groups for which this rule is applicable. Accepts JSON string or list."
+    ),
+]
+
+_ZpaAppSegments = Annotated[
+    Optional[Union[List[int], str]],
+    Field(
+        description="IDs for Source IP Anchoring-enabled ZPA Application Segments. Accepts JSON string or list."
+    ),
+]
+
+_ResolveCloudApps = Annotated[
+    bool,
+    Field(
+        description=(
+            "When True (default), friendly cloud-application names supplied "
+            "via cloud_applications are resolved to canonical ZIA enum "
+            "tokens by consulting the policy-engine SSL catalog. Set False "
+            "to pass cloud_applications through unchanged (advanced)."
+        )
+    ),
+]
+
 
 def _resolve_cloud_apps_in_place(
     cloud_applications: Optional[Union[List[str], str]],
@@ -56,6 +224,52 @@ def _resolve_cloud_apps_in_place(
 # Helper Functions
 # ============================================================================
 
+# Payload keys copied through unchanged / normalized with ``parse_list``.
+# Kept at module scope so the builder does not rebuild them on every call.
+_CORE_PARAMS = ("name", "description", "enabled", "rank", "order")
+
+_LIST_PARAMS = (
+    "device_trust_levels",
+    "user_agent_types",
+    "platforms",
+    "cloud_applications",
+    "url_categories",
+    "dest_ip_groups",
+    "source_ip_groups",
+    "devices",
+    "device_groups",
+    "groups",
+    "users",
+    "labels",
+    "locations",
+    "location_groups",
+    "proxy_gateways",
+    "workload_groups",
+    "zpa_app_segments",
+)
+
+# Hard ZIA limit on the SSL inspection rule ``name`` field. Enforced
+# client-side so an over-long name fails before cloud-app resolution and
+# the API round trip instead of with a generic ``INVALID_INPUT_ARGUMENT``.
+_SSL_RULE_NAME_MAX_LENGTH = 31
+
+
+def _validate_ssl_rule_name(name: Optional[str]) -> None:
+    """Reject empty SSL inspection rule names and names over 31 characters.
+
+    ``None`` is accepted so update calls that omit ``name`` (relying on
+    the backfill from the existing rule) pass through unchanged.
+    """
+    if name is None:
+        return
+    if not name.strip():
+        raise ValueError("SSL inspection rule name must not be empty")
+    if len(name) > _SSL_RULE_NAME_MAX_LENGTH:
+        raise ValueError(
+            f"SSL inspection rule name must be {_SSL_RULE_NAME_MAX_LENGTH} "
+            f"characters or fewer (got {len(name)}: {name!r})"
+        )
+
 
 def _build_ssl_inspection_rule_payload(
     name: Optional[str] = None,
@@ -86,26 +300,20 @@ def _build_ssl_inspection_rule_payload(
     zpa_app_segments: Optional[Union[List[int], str]] = None,
 ) -> dict:
     """Build payload for SSL inspection rule operations."""
+    args = locals()
     payload = {}
 
     # Core parameters
-    if name is not None:
-        payload["name"] = name
-    if description is not None:
-        payload["description"] = description
-    if enabled is not None:
-        payload["enabled"] = enabled
-    if rank is not None:
-        payload["rank"] = rank
-    if order is not None:
-        payload["order"] = order
+    for param_name in _CORE_PARAMS:
+        if args[param_name] is not None:
+            payload[param_name] = args[param_name]
 
     # Action parameter - can be dict or JSON string
     if action is not None:
         if isinstance(action, str):
             try:
-                action = json.loads(action)
-            except json.JSONDecodeError as exc:
+                action = orjson.loads(action)
+            except orjson.JSONDecodeError as exc:
                 raise ValueError(f"Invalid JSON string for action: {exc}")
         if isinstance(action, dict):
             payload["action"] = action
@@ -113,27 +321,9 @@ def _build_ssl_inspection_rule_payload(
             raise ValueError("Action must be a dictionary or JSON string")
 
     # List parameters that need parsing
-    for param_name, param_value in [
-        ("device_trust_levels", device_trust_levels),
-        ("user_agent_types", user_agent_types),
-        ("platforms", platforms),
-        ("cloud_applications", cloud_applications),
-        ("url_categories", url_categories),
-        ("dest_ip_groups", dest_ip_groups),
-        ("source_ip_groups", source_ip_groups),
-        ("devices", devices),
-        ("device_groups", device_groups),
-        ("groups", groups),
-        ("users", users),
-        ("labels", labels),
-        ("locations", locations),
-        ("location_groups", location_groups),
-        ("proxy_gateways", proxy_gateways),
-        ("workload_groups", workload_groups),
-        ("zpa_app_segments", zpa_app_segments),
-    ]:
-        if param_value is not None:
-            payload[param_name] = parse_list(param_value)
+    for param_name in _LIST_PARAMS:
+        if args[param_name] is not None:
+            payload[param_name] = parse_list(args[param_name])
 
     # Boolean parameters
     if road_warrior_for_kerberos is not None:
@@ -159,7 +349,7 @@ def zia_list_ssl_inspection_rules(
         Optional[str],
         Field(description="JMESPath expression for client-side filtering/projection of results."),
     ] = None,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> List[dict]:
     """
     Lists all ZIA SSL Inspection Rules with optional search filtering.
@@ -212,10 +402,11 @@ def zia_list_ssl_inspection_rules(
     client = get_zscaler_client(service=service)
     ssl_inspection = client.zia.ssl_inspection_rules
 
-    query = {"search": search} if search else {}
-    rules, _, err = ssl_inspection.list_rules(query_params=query)
-    if err:
-        raise Exception(f"Failed to list SSL inspection rules: {err}")
+    query_params = {"search": search} if search else None
+    rules = check_result(
+        ssl_inspection.list_rules(query_params=query_params),
+        "list SSL inspection rules",
+    )
     results = [r.as_dict() for r in rules]
     return apply_jmespath(results, query)
 
@@ -224,7 +415,7 @@ def zia_get_ssl_inspection_rule(
     rule_id: Annotated[
         Union[int, str], Field(description="The ID of the SSL inspection rule to retrieve.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Gets a specific ZIA SSL Inspection Rule by ID.
@@ -298,9 +489,7 @@ def zia_get_ssl_inspection_rule(
     client = get_zscaler_client(service=service)
     ssl_inspection = client.zia.ssl_inspection_rules
 
-    rule, _, err = ssl_inspection.get_rule(rule_id)
-    if err:
-        raise Exception(f"Failed to retrieve SSL inspection rule {rule_id}: {err}")
+    rule = check_result(ssl_inspection.get_rule(rule_id), f"retrieve SSL inspection rule {rule_id}")
     return rule.as_dict()
 
 
@@ -321,155 +510,36 @@ def zia_create_ssl_inspection_rule(
             )
         ),
     ],
-    description: Annotated[Optional[str], Field(description="Optional rule description.")] = None,
+    description: _Description = None,
     enabled: Annotated[
         Optional[bool], Field(description="True to enable rule, False to disable (default: True).")
     ] = True,
-    rank: Annotated[
-        Optional[int], Field(description=RANK_FIELD_DESCRIPTION)
-    ] = None,
+    rank: _Rank = None,
     order: Annotated[
         Optional[int], Field(description="Rule order/priority, defaults to the bottom of the list.")
     ] = None,
-    road_warrior_for_kerberos: Annotated[
-        Optional[bool],
-        Field(
-            description="If True, the rule is applied to remote users that use PAC with Kerberos authentication."
-        ),
-    ] = None,
-    predefined: Annotated[
-        Optional[bool],
-        Field(description="Indicates that the rule is predefined by using a true value."),
-    ] = None,
-    default_rule: Annotated[
-        Optional[bool],
-        Field(
-            description="Indicates whether the rule is the Default Cloud SSL Inspection Rule or not."
-        ),
-    ] = None,
-    device_trust_levels: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Device trust levels for which the rule must be applied. "
-                "Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    user_agent_types: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "User Agent types on which this rule will be applied. "
-                "Values: OPERA, FIREFOX, MSIE, MSEDGE, CHROME, SAFARI, OTHER, MSCHREDGE. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    platforms: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Platform types for which the rule must be applied. "
-                "Values: SCAN_IOS, SCAN_ANDROID, SCAN_MACOS, SCAN_WINDOWS, NO_CLIENT_CONNECTOR, SCAN_LINUX. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    cloud_applications: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Cloud applications for which the SSL inspection rule is applied. "
-                "Accepts EITHER canonical ZIA enum tokens (e.g. 'ONEDRIVE', "
-                "'SHAREPOINT_ONLINE') OR friendly display names ('OneDrive', "
-                "'share point online'). Friendly names are auto-resolved to the "
-                "canonical enum via the policy-engine SSL catalog before the "
-                "API call — set resolve_cloud_apps=False to disable. Accepts "
-                "JSON string or list."
-            )
-        ),
-    ] = None,
-    url_categories: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "URL categories for which the rule must be applied. "
-                "Accepts URL category names. Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    dest_ip_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for destination IP groups. Accepts JSON string or list."),
-    ] = None,
-    source_ip_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for source IP groups. Accepts JSON string or list."),
-    ] = None,
-    devices: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for devices managed by Zscaler Client Connector. Accepts JSON string or list."
-        ),
-    ] = None,
-    device_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for device groups managed by Zscaler Client Connector. Accepts JSON string or list."
-        ),
-    ] = None,
-    groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for user groups the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    users: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for users the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    labels: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for labels the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    locations: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for locations the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    location_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for location groups. Accepts JSON string or list."),
-    ] = None,
-    proxy_gateways: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for proxy chaining gateways for which this rule is applicable. Accepts JSON string or list."
-        ),
-    ] = None,
-    workload_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for workload groups for which this rule is applicable. Accepts JSON string or list."
-        ),
-    ] = None,
-    zpa_app_segments: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for Source IP Anchoring-enabled ZPA Application Segments. Accepts JSON string or list."
-        ),
-    ] = None,
-    resolve_cloud_apps: Annotated[
-        bool,
-        Field(
-            description=(
-                "When True (default), friendly cloud-application names supplied "
-                "via cloud_applications are resolved to canonical ZIA enum "
-                "tokens by consulting the policy-engine SSL catalog. Set False "
-                "to pass cloud_applications through unchanged (advanced)."
-            )
-        ),
-    ] = True,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    road_warrior_for_kerberos: _RoadWarriorForKerberos = None,
+    predefined: _Predefined = None,
+    default_rule: _DefaultRule = None,
+    device_trust_levels: _DeviceTrustLevels = None,
+    user_agent_types: _UserAgentTypes = None,
+    platforms: _Platforms = None,
+    cloud_applications: _CloudApplications = None,
+    url_categories: _UrlCategories = None,
+    dest_ip_groups: _DestIpGroups = None,
+    source_ip_groups: _SourceIpGroups = None,
+    devices: _Devices = None,
+    device_groups: _DeviceGroups = None,
+    groups: _Groups = None,
+    users: _Users = None,
+    labels: _Labels = None,
+    locations: _Locations = None,
+    location_groups: _LocationGroups = None,
+    proxy_gateways: _ProxyGateways = None,
+    workload_groups: _WorkloadGroups = None,
+    zpa_app_segments: _ZpaAppSegments = None,
+    resolve_cloud_apps: _ResolveCloudApps = True,
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Creates a new ZIA SSL Inspection Rule.
@@ -608,6 +678,8 @@ def zia_create_ssl_inspection_rule(
         ...     road_warrior_for_kerberos=True
         ... )
     """
+    _validate_ssl_rule_name(name)
+
     cloud_apps_audit: Optional[dict] = None
     if resolve_cloud_apps and cloud_applications is not None:
         cloud_applications, cloud_apps_audit = _resolve_cloud_apps_in_place(
@@ -648,9 +720,7 @@ def zia_create_ssl_inspection_rule(
     client = get_zscaler_client(service=service)
     ssl_inspection = client.zia.ssl_inspection_rules
 
-    rule, _, err = ssl_inspection.add_rule(**payload)
-    if err:
-        raise Exception(f"Failed to add SSL inspection rule: {err}")
+    rule = check_result(ssl_inspection.add_rule(**payload), "add SSL inspection rule")
     result = rule.as_dict()
     if cloud_apps_audit:
         result["_cloud_applications_resolution"] = cloud_apps_audit
@@ -673,153 +743,34 @@ def zia_update_ssl_inspection_rule(
             )
         ),
     ] = None,
-    description: Annotated[Optional[str], Field(description="Optional rule description.")] = None,
+    description: _Description = None,
     enabled: Annotated[
         Optional[bool], Field(description="True to enable rule, False to disable.")
     ] = None,
-    rank: Annotated[
-        Optional[int], Field(description=RANK_FIELD_DESCRIPTION)
-    ] = None,
+    rank: _Rank = None,
     order: Annotated[Optional[int], Field(description="Rule order/priority.")] = None,
-    road_warrior_for_kerberos: Annotated[
-        Optional[bool],
-        Field(
-            description="If True, the rule is applied to remote users that use PAC with Kerberos authentication."
-        ),
-    ] = None,
-    predefined: Annotated[
-        Optional[bool],
-        Field(description="Indicates that the rule is predefined by using a true value."),
-    ] = None,
-    default_rule: Annotated[
-        Optional[bool],
-        Field(
-            description="Indicates whether the rule is the Default Cloud SSL Inspection Rule or not."
-        ),
-    ] = None,
-    device_trust_levels: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Device trust levels for which the rule must be applied. "
-                "Values: ANY, UNKNOWN_DEVICETRUSTLEVEL, LOW_TRUST, MEDIUM_TRUST, HIGH_TRUST. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    user_agent_types: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "User Agent types on which this rule will be applied. "
-                "Values: OPERA, FIREFOX, MSIE, MSEDGE, CHROME, SAFARI, OTHER, MSCHREDGE. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    platforms: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Platform types for which the rule must be applied. "
-                "Values: SCAN_IOS, SCAN_ANDROID, SCAN_MACOS, SCAN_WINDOWS, NO_CLIENT_CONNECTOR, SCAN_LINUX. "
-                "Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    cloud_applications: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "Cloud applications for which the SSL inspection rule is applied. "
-                "Accepts EITHER canonical ZIA enum tokens (e.g. 'ONEDRIVE', "
-                "'SHAREPOINT_ONLINE') OR friendly display names ('OneDrive', "
-                "'share point online'). Friendly names are auto-resolved to the "
-                "canonical enum via the policy-engine SSL catalog before the "
-                "API call — set resolve_cloud_apps=False to disable. Accepts "
-                "JSON string or list."
-            )
-        ),
-    ] = None,
-    url_categories: Annotated[
-        Optional[Union[List[str], str]],
-        Field(
-            description=(
-                "URL categories for which the rule must be applied. "
-                "Accepts URL category names. Accepts JSON string or list."
-            )
-        ),
-    ] = None,
-    dest_ip_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for destination IP groups. Accepts JSON string or list."),
-    ] = None,
-    source_ip_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for source IP groups. Accepts JSON string or list."),
-    ] = None,
-    devices: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for devices managed by Zscaler Client Connector. Accepts JSON string or list."
-        ),
-    ] = None,
-    device_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for device groups managed by Zscaler Client Connector. Accepts JSON string or list."
-        ),
-    ] = None,
-    groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for user groups the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    users: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for users the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    labels: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for labels the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    locations: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for locations the rule applies to. Accepts JSON string or list."),
-    ] = None,
-    location_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(description="IDs for location groups. Accepts JSON string or list."),
-    ] = None,
-    proxy_gateways: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for proxy chaining gateways for which this rule is applicable. Accepts JSON string or list."
-        ),
-    ] = None,
-    workload_groups: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for workload groups for which this rule is applicable. Accepts JSON string or list."
-        ),
-    ] = None,
-    zpa_app_segments: Annotated[
-        Optional[Union[List[int], str]],
-        Field(
-            description="IDs for Source IP Anchoring-enabled ZPA Application Segments. Accepts JSON string or list."
-        ),
-    ] = None,
-    resolve_cloud_apps: Annotated[
-        bool,
-        Field(
-            description=(
-                "When True (default), friendly cloud-application names supplied "
-                "via cloud_applications are resolved to canonical ZIA enum "
-                "tokens by consulting the policy-engine SSL catalog. Set False "
-                "to pass cloud_applications through unchanged (advanced)."
-            )
-        ),
-    ] = True,
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    road_warrior_for_kerberos: _RoadWarriorForKerberos = None,
+    predefined: _Predefined = None,
+    default_rule: _DefaultRule = None,
+    device_trust_levels: _DeviceTrustLevels = None,
+    user_agent_types: _UserAgentTypes = None,
+    platforms: _Platforms = None,
+    cloud_applications: _CloudApplications = None,
+    url_categories: _UrlCategories = None,
+    dest_ip_groups: _DestIpGroups = None,
+    source_ip_groups: _SourceIpGroups = None,
+    devices: _Devices = None,
+    device_groups: _DeviceGroups = None,
+    groups: _Groups = None,
+    users: _Users = None,
+    labels: _Labels = None,
+    locations: _Locations = None,
+    location_groups: _LocationGroups = None,
+    proxy_gateways: _ProxyGateways = None,
+    workload_groups: _WorkloadGroups = None,
+    zpa_app_segments: _ZpaAppSegments = None,
+    resolve_cloud_apps: _ResolveCloudApps = True,
+    service: ServiceParam = "zia",
 ) -> dict:
     """
     Updates an existing ZIA SSL Inspection Rule.
@@ -956,6 +907,8 @@ def zia_update_ssl_inspection_rule(
         ...     user_agent_types=["CHROME", "FIREFOX", "SAFARI"]
         ... )
     """
+    _validate_ssl_rule_name(name)
+
     cloud_apps_audit: Optional[dict] = None
     if resolve_cloud_apps and cloud_applications is not None:
         cloud_applications, cloud_apps_audit = _resolve_cloud_apps_in_place(
@@ -1004,29 +957,30 @@ def zia_update_ssl_inspection_rule(
     # caller did not supply them, so partial updates "just work" without
     # exposing the merge as a user-facing knob.
     if "name" not in payload or "order" not in payload:
-        existing, _, fetch_err = ssl_inspection.get_rule(rule_id)
-        if fetch_err:
-            raise Exception(
-                f"Failed to fetch SSL inspection rule {rule_id} for required-field backfill: {fetch_err}"
-            )
+        existing = check_result(
+            ssl_inspection.get_rule(rule_id),
+            f"fetch SSL inspection rule {rule_id} for required-field backfill",
+        )
         existing_dict = existing.as_dict()
         payload.setdefault("name", existing_dict.get("name"))
         payload.setdefault("order", existing_dict.get("order"))
 
-    rule, _, err = ssl_inspection.update_rule(rule_id, **payload)
-    if err:
-        raise Exception(f"Failed to update SSL inspection rule {rule_id}: {err}")
+    rule = check_result(
+        ssl_inspection.update_rule(rule_id, **payload),
+        f"update SSL inspection rule {rule_id}",
+    )
     result = rule.as_dict()
     if cloud_apps_audit:
         result["_cloud_applications_resolution"] = cloud_apps_audit
     return result
 
 
+@requires_confirmation("rule_id")
 def zia_delete_ssl_inspection_rule(
     rule_id: Annotated[
         Union[int, str], Field(description="The ID of the SSL inspection rule to delete.")
     ],
-    service: Annotated[str, Field(description="The service to use.")] = "zia",
+    service: ServiceParam = "zia",
     kwargs: str = "{}",
 ) -> str:
     """
@@ -1075,21 +1029,8 @@ def zia_delete_ssl_inspection_rule(
         ...     result = zia_delete_ssl_inspection_rule(rule_id=rule_id)
         ...     print(result)
     """
-    from zscaler_mcp.common.elicitation import check_confirmation, extract_confirmed_from_kwargs
-
-    # Extract confirmation from kwargs (hidden from tool schema)
-    confirmed = extract_confirmed_from_kwargs(kwargs)
-
-    confirmation_check = check_confirmation(
-        "zia_delete_ssl_inspection_rule", confirmed, {"rule_id": str(rule_id)}
-    )
-    if confirmation_check:
-        return confirmation_check
-
     client = get_zscaler_client(service=service)
     ssl_inspection = client.zia.ssl_inspection_rules
 
-    _, _, err = ssl_inspection.delete_rule(rule_id)
-    if err:
-        raise Exception(f"Failed to delete SSL inspection rule {rule_id}: {err}")
+    check_result(ssl_inspection.delete_rule(rule_id), f"delete SSL inspection rule {rule_id}")
     return f"SSL inspection rule {rule_id} deleted successfully."
@@ -1,9 +1,9 @@
-import json
 import platform
 import sys
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import orjson
 import pycountry
 
 
@@ -30,12 +30,33 @@ def parse_list(val: Union[str, List, Any]) -> Union[List, Any]:
     """
     if isinstance(val, str):
         try:
-            return json.loads(val)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(val)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(f"Invalid JSON string: {exc}")
     return val
 
 
+def dedupe_list(val: Union[List, Any]) -> Union[List, Any]:
+    """
+    Drop repeated entries from a list while keeping first-seen order.
+
+    Args:
+        val: A list of hashable items, or any other value.
+
+    Returns:
+        A new list without duplicates if input was a list, otherwise the value as-is.
+
+    Examples:
+        >>> dedupe_list(["10.0.0.1", "10.0.0.2", "10.0.0.1"])
+        ['10.0.0.1', '10.0.0.2']
+        >>> dedupe_list(None) is None
+        True
+    """
+    if isinstance(val, list):
+        return list(dict.fromkeys(val))
+    return val
+
+
 def convert_v2_to_sdk_format(conditions: Any) -> List[Union[Tuple, List]]:
     """
     Convert various condition formats to the SDK's expected v2 format.
@@ -51,8 +72,8 @@ def convert_v2_to_sdk_format(conditions: Any) -> List[Union[Tuple, List]]:
     # ✅ Step 1: Parse JSON string if passed
     if isinstance(conditions, str):
         try:
-            conditions = json.loads(conditions)
-        except json.JSONDecodeError as e:
+            conditions = orjson.loads(conditions)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON string for conditions: {e}")
 
     # ✅ Step 2: Normalize SDK-style tuples/lists
@@ -486,8 +507,8 @@ def validate_and_convert_country_codes(country_inputs: Union[List[str], str]) ->
     """
     if isinstance(country_inputs, str):
         try:
-            country_inputs = json.loads(country_inputs)
-        except json.JSONDecodeError as e:
+            country_inputs = orjson.loads(country_inputs)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON string for countries: {e}")
 
     if not isinstance(country_inputs, list):